@@ -3,6 +3,11 @@ Empire 3D Game Configuration
 Central configuration file for all game settings and constants
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+
 # ============================================================================
 # SCREEN AND DISPLAY SETTINGS
 # ============================================================================
@@ -13,285 +18,350 @@ FULLSCREEN = False
 VSYNC_ENABLED = True
 
 # Display modes
-DISPLAY_RESOLUTION_OPTIONS = [
+DISPLAY_RESOLUTION_OPTIONS = (
     (1280, 720),
     (1600, 900),
     (1920, 1080),
     (2560, 1440),
-]
+)
 
 # ============================================================================
 # COLOR PALETTE
 # ============================================================================
+# Basic colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+
+# Grayscale
+DARK_GRAY = (64, 64, 64)
+GRAY = (128, 128, 128)
+LIGHT_GRAY = (192, 192, 192)
+
+# Team colors
+TEAM_1 = (30, 144, 255)      # Dodger Blue
+TEAM_2 = (220, 20, 60)       # Crimson Red
+TEAM_3 = (50, 205, 50)       # Lime Green
+TEAM_4 = (255, 140, 0)       # Dark Orange
+NEUTRAL = (128, 128, 128)    # Gray
+
+# UI colors
+UI_BACKGROUND = (20, 20, 30)
+UI_PANEL = (40, 40, 60)
+UI_BORDER = (100, 100, 150)
+UI_HOVER = (150, 150, 200)
+UI_ACTIVE = (100, 200, 255)
+
+# Resource colors
+GOLD = (255, 215, 0)
+WOOD = (139, 69, 19)
+STONE = (169, 169, 169)
+IRON = (70, 70, 70)
+FOOD = (34, 139, 34)
+
+# Status colors
+HEALTH_GOOD = (0, 255, 0)
+HEALTH_WARNING = (255, 165, 0)
+HEALTH_CRITICAL = (255, 0, 0)
+
+# Name -> color lookup for colors chosen at runtime (e.g. by team id)
 COLORS = {
-    # Basic colors
-    'WHITE': (255, 255, 255),
-    'BLACK': (0, 0, 0),
-    'RED': (255, 0, 0),
-    'GREEN': (0, 255, 0),
-    'BLUE': (0, 0, 255),
-    'YELLOW': (255, 255, 0),
-    'CYAN': (0, 255, 255),
-    'MAGENTA': (255, 0, 255),
-    
-    # Grayscale
-    'DARK_GRAY': (64, 64, 64),
-    'GRAY': (128, 128, 128),
-    'LIGHT_GRAY': (192, 192, 192),
-    
-    # Team colors
-    'TEAM_1': (30, 144, 255),      # Dodger Blue
-    'TEAM_2': (220, 20, 60),       # Crimson Red
-    'TEAM_3': (50, 205, 50),       # Lime Green
-    'TEAM_4': (255, 140, 0),       # Dark Orange
-    'NEUTRAL': (128, 128, 128),    # Gray
-    
-    # UI colors
-    'UI_BACKGROUND': (20, 20, 30),
-    'UI_PANEL': (40, 40, 60),
-    'UI_BORDER': (100, 100, 150),
-    'UI_HOVER': (150, 150, 200),
-    'UI_ACTIVE': (100, 200, 255),
-    
-    # Resource colors
-    'GOLD': (255, 215, 0),
-    'WOOD': (139, 69, 19),
-    'STONE': (169, 169, 169),
-    'IRON': (70, 70, 70),
-    'FOOD': (34, 139, 34),
-    
-    # Status colors
-    'HEALTH_GOOD': (0, 255, 0),
-    'HEALTH_WARNING': (255, 165, 0),
-    'HEALTH_CRITICAL': (255, 0, 0),
+    'WHITE': WHITE,
+    'BLACK': BLACK,
+    'RED': RED,
+    'GREEN': GREEN,
+    'BLUE': BLUE,
+    'YELLOW': YELLOW,
+    'CYAN': CYAN,
+    'MAGENTA': MAGENTA,
+    'DARK_GRAY': DARK_GRAY,
+    'GRAY': GRAY,
+    'LIGHT_GRAY': LIGHT_GRAY,
+    'TEAM_1': TEAM_1,
+    'TEAM_2': TEAM_2,
+    'TEAM_3': TEAM_3,
+    'TEAM_4': TEAM_4,
+    'NEUTRAL': NEUTRAL,
+    'UI_BACKGROUND': UI_BACKGROUND,
+    'UI_PANEL': UI_PANEL,
+    'UI_BORDER': UI_BORDER,
+    'UI_HOVER': UI_HOVER,
+    'UI_ACTIVE': UI_ACTIVE,
+    'GOLD': GOLD,
+    'WOOD': WOOD,
+    'STONE': STONE,
+    'IRON': IRON,
+    'FOOD': FOOD,
+    'HEALTH_GOOD': HEALTH_GOOD,
+    'HEALTH_WARNING': HEALTH_WARNING,
+    'HEALTH_CRITICAL': HEALTH_CRITICAL,
 }
 
 # ============================================================================
 # UNIT STATS AND CONFIGURATION
 # ============================================================================
+class UnitTypeStats(NamedTuple):
+    """Static stats for a unit type"""
+    name: str
+    health: int
+    attack: int
+    defense: int
+    speed: float
+    range: float
+    cost: Mapping[str, int]
+    training_time: int  # seconds
+    armor: int
+    mana: int = 0
+    vision_range: float = 0.0
+
+
 UNIT_TYPES = {
-    'SOLDIER': {
-        'name': 'Soldier',
-        'health': 100,
-        'attack': 15,
-        'defense': 5,
-        'speed': 5.0,
-        'range': 1.0,
-        'cost': {
+    'SOLDIER': UnitTypeStats(
+        name='Soldier',
+        health=100,
+        attack=15,
+        defense=5,
+        speed=5.0,
+        range=1.0,
+        cost={
             'gold': 50,
             'wood': 10,
             'food': 20,
         },
-        'training_time': 30,  # seconds
-        'armor': 2,
-    },
-    'ARCHER': {
-        'name': 'Archer',
-        'health': 60,
-        'attack': 20,
-        'defense': 3,
-        'speed': 4.5,
-        'range': 8.0,
-        'cost': {
+        training_time=30,  # seconds
+        armor=2,
+    ),
+    'ARCHER': UnitTypeStats(
+        name='Archer',
+        health=60,
+        attack=20,
+        defense=3,
+        speed=4.5,
+        range=8.0,
+        cost={
             'gold': 75,
             'wood': 30,
             'food': 15,
         },
-        'training_time': 40,
-        'armor': 1,
-    },
-    'CAVALRY': {
-        'name': 'Cavalry',
-        'health': 150,
-        'attack': 25,
-        'defense': 8,
-        'speed': 7.5,
-        'range': 1.0,
-        'cost': {
+        training_time=40,
+        armor=1,
+    ),
+    'CAVALRY': UnitTypeStats(
+        name='Cavalry',
+        health=150,
+        attack=25,
+        defense=8,
+        speed=7.5,
+        range=1.0,
+        cost={
             'gold': 150,
             'wood': 50,
             'food': 40,
         },
-        'training_time': 60,
-        'armor': 5,
-    },
-    'MAGE': {
-        'name': 'Mage',
-        'health': 50,
-        'attack': 30,
-        'defense': 2,
-        'speed': 3.5,
-        'range': 10.0,
-        'cost': {
+        training_time=60,
+        armor=5,
+    ),
+    'MAGE': UnitTypeStats(
+        name='Mage',
+        health=50,
+        attack=30,
+        defense=2,
+        speed=3.5,
+        range=10.0,
+        cost={
             'gold': 200,
             'wood': 20,
             'food': 10,
         },
-        'training_time': 80,
-        'armor': 0,
-        'mana': 100,
-    },
-    'PALADIN': {
-        'name': 'Paladin',
-        'health': 200,
-        'attack': 28,
-        'defense': 12,
-        'speed': 5.0,
-        'range': 1.5,
-        'cost': {
+        training_time=80,
+        armor=0,
+        mana=100,
+    ),
+    'PALADIN': UnitTypeStats(
+        name='Paladin',
+        health=200,
+        attack=28,
+        defense=12,
+        speed=5.0,
+        range=1.5,
+        cost={
             'gold': 300,
             'wood': 60,
             'food': 50,
         },
-        'training_time': 120,
-        'armor': 8,
-    },
-    'SCOUT': {
-        'name': 'Scout',
-        'health': 30,
-        'attack': 8,
-        'defense': 1,
-        'speed': 10.0,
-        'range': 1.0,
-        'cost': {
+        training_time=120,
+        armor=8,
+    ),
+    'SCOUT': UnitTypeStats(
+        name='Scout',
+        health=30,
+        attack=8,
+        defense=1,
+        speed=10.0,
+        range=1.0,
+        cost={
             'gold': 25,
             'wood': 5,
             'food': 10,
         },
-        'training_time': 15,
-        'armor': 0,
-        'vision_range': 20.0,
-    },
+        training_time=15,
+        armor=0,
+        vision_range=20.0,
+    ),
 }
 
 # Unit group limits
 MAX_UNIT_GROUP_SIZE = 100
-UNIT_FORMATION_TYPES = ['Line', 'Square', 'Column', 'Wedge', 'Circle']
+UNIT_FORMATION_TYPES = ('Line', 'Square', 'Column', 'Wedge', 'Circle')
+UNIT_FORMATION_SET = frozenset(UNIT_FORMATION_TYPES)  # O(1) validation
 
 # ============================================================================
 # BUILDING TYPES AND CONFIGURATION
 # ============================================================================
+class BuildingTypeStats(NamedTuple):
+    """Static stats for a building type"""
+    name: str
+    health: int
+    defense: int
+    width: int
+    height: int
+    cost: Mapping[str, int]
+    construction_time: int  # seconds
+    unit_production: Tuple[str, ...] = ()
+    capacity: int = 0  # max units training
+    attack: int = 0
+    attack_range: float = 0.0
+    gather_rate: float = 0.0  # resources per second
+    storage_capacity: int = 0
+    special: Optional[str] = None
+
+
 BUILDING_TYPES = {
-    'BARRACKS': {
-        'name': 'Barracks',
-        'health': 500,
-        'defense': 10,
-        'width': 3,
-        'height': 3,
-        'cost': {
+    'BARRACKS': BuildingTypeStats(
+        name='Barracks',
+        health=500,
+        defense=10,
+        width=3,
+        height=3,
+        cost={
             'gold': 200,
             'wood': 500,
             'stone': 300,
         },
-        'construction_time': 120,  # seconds
-        'unit_production': ['SOLDIER', 'ARCHER', 'SCOUT'],
-        'capacity': 30,  # max units training
-    },
-    'STABLE': {
-        'name': 'Stable',
-        'health': 400,
-        'defense': 8,
-        'width': 3,
-        'height': 3,
-        'cost': {
+        construction_time=120,  # seconds
+        unit_production=('SOLDIER', 'ARCHER', 'SCOUT'),
+        capacity=30,  # max units training
+    ),
+    'STABLE': BuildingTypeStats(
+        name='Stable',
+        health=400,
+        defense=8,
+        width=3,
+        height=3,
+        cost={
             'gold': 300,
             'wood': 400,
             'stone': 200,
         },
-        'construction_time': 150,
-        'unit_production': ['CAVALRY', 'PALADIN'],
-        'capacity': 20,
-    },
-    'MAGE_TOWER': {
-        'name': 'Mage Tower',
-        'health': 300,
-        'defense': 5,
-        'width': 2,
-        'height': 2,
-        'cost': {
+        construction_time=150,
+        unit_production=('CAVALRY', 'PALADIN'),
+        capacity=20,
+    ),
+    'MAGE_TOWER': BuildingTypeStats(
+        name='Mage Tower',
+        health=300,
+        defense=5,
+        width=2,
+        height=2,
+        cost={
             'gold': 500,
             'wood': 200,
             'stone': 400,
         },
-        'construction_time': 180,
-        'unit_production': ['MAGE'],
-        'capacity': 10,
-    },
-    'WALL': {
-        'name': 'Wall',
-        'health': 800,
-        'defense': 20,
-        'width': 1,
-        'height': 1,
-        'cost': {
+        construction_time=180,
+        unit_production=('MAGE',),
+        capacity=10,
+    ),
+    'WALL': BuildingTypeStats(
+        name='Wall',
+        health=800,
+        defense=20,
+        width=1,
+        height=1,
+        cost={
             'gold': 50,
             'wood': 100,
             'stone': 500,
         },
-        'construction_time': 60,
-        'unit_production': [],
-    },
-    'TOWER': {
-        'name': 'Defense Tower',
-        'health': 600,
-        'defense': 15,
-        'width': 2,
-        'height': 2,
-        'cost': {
+        construction_time=60,
+        unit_production=(),
+    ),
+    'TOWER': BuildingTypeStats(
+        name='Defense Tower',
+        health=600,
+        defense=15,
+        width=2,
+        height=2,
+        cost={
             'gold': 300,
             'wood': 200,
             'stone': 400,
         },
-        'construction_time': 120,
-        'attack': 25,
-        'attack_range': 12.0,
-        'unit_production': [],
-    },
-    'RESOURCE_GATHERER': {
-        'name': 'Resource Gatherer',
-        'health': 200,
-        'defense': 3,
-        'width': 2,
-        'height': 2,
-        'cost': {
+        construction_time=120,
+        attack=25,
+        attack_range=12.0,
+        unit_production=(),
+    ),
+    'RESOURCE_GATHERER': BuildingTypeStats(
+        name='Resource Gatherer',
+        health=200,
+        defense=3,
+        width=2,
+        height=2,
+        cost={
             'gold': 100,
             'wood': 300,
             'stone': 100,
         },
-        'construction_time': 90,
-        'unit_production': [],
-        'gather_rate': 0.5,  # resources per second
-    },
-    'WAREHOUSE': {
-        'name': 'Warehouse',
-        'health': 400,
-        'defense': 5,
-        'width': 3,
-        'height': 3,
-        'cost': {
+        construction_time=90,
+        unit_production=(),
+        gather_rate=0.5,  # resources per second
+    ),
+    'WAREHOUSE': BuildingTypeStats(
+        name='Warehouse',
+        health=400,
+        defense=5,
+        width=3,
+        height=3,
+        cost={
             'gold': 100,
             'wood': 400,
             'stone': 200,
         },
-        'construction_time': 100,
-        'storage_capacity': 5000,
-        'unit_production': [],
-    },
-    'TOWNHALL': {
-        'name': 'Town Hall',
-        'health': 1000,
-        'defense': 20,
-        'width': 4,
-        'height': 4,
-        'cost': {
+        construction_time=100,
+        storage_capacity=5000,
+        unit_production=(),
+    ),
+    'TOWNHALL': BuildingTypeStats(
+        name='Town Hall',
+        health=1000,
+        defense=20,
+        width=4,
+        height=4,
+        cost={
             'gold': 500,
             'wood': 800,
             'stone': 600,
         },
-        'construction_time': 300,
-        'unit_production': [],
-        'special': 'faction_center',
-    },
+        construction_time=300,
+        unit_production=(),
+        special='faction_center',
+    ),
 }
 
 # ============================================================================
@@ -310,7 +380,7 @@ MAP_SETTINGS = {
         'iron': 200,
         'food': 400,
     },
-    'TERRAIN_TYPES': ['grass', 'forest', 'mountain', 'water', 'desert', 'swamp'],
+    'TERRAIN_TYPES': ('grass', 'forest', 'mountain', 'water', 'desert', 'swamp'),
     'RESOURCE_SPAWN_RATE': 0.1,  # percentage of tiles
     'FOG_OF_WAR_ENABLED': True,
 }
@@ -364,41 +434,58 @@ BALANCE = {
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
+class AbilityStats(NamedTuple):
+    """Static stats for a special ability"""
+    name: str
+    unit_types: Tuple[str, ...]
+    cooldown: float  # seconds
+    mana_cost: int
+    duration: float = 0
+    speed_multiplier: float = 1.0
+    damage_multiplier: float = 1.0
+    range: float = 0.0
+    radius: float = 0.0
+    damage: int = 0
+    stun_duration: float = 0
+    projectiles: int = 0
+    spread_angle: float = 0
+
+
 ABILITIES = {
-    'CHARGE': {
-        'name': 'Charge',
-        'unit_types': ['CAVALRY', 'PALADIN'],
-        'cooldown': 10,  # seconds
-        'duration': 3,
-        'speed_multiplier': 2.0,
-        'damage_multiplier': 1.5,
-        'mana_cost': 30,
-    },
-    'FIREBALL': {
-        'name': 'Fireball',
-        'unit_types': ['MAGE'],
-        'cooldown': 8,
-        'range': 15.0,
-        'radius': 5.0,
-        'damage': 50,
-        'mana_cost': 50,
-    },
-    'SHIELD_BASH': {
-        'name': 'Shield Bash',
-        'unit_types': ['PALADIN', 'SOLDIER'],
-        'cooldown': 12,
-        'stun_duration': 2,
-        'range': 3.0,
-        'mana_cost': 20,
-    },
-    'VOLLEY': {
-        'name': 'Volley',
-        'unit_types': ['ARCHER'],
-        'cooldown': 6,
-        'projectiles': 5,
-        'spread_angle': 30,
-        'mana_cost': 25,
-    },
+    'CHARGE': AbilityStats(
+        name='Charge',
+        unit_types=('CAVALRY', 'PALADIN'),
+        cooldown=10,  # seconds
+        duration=3,
+        speed_multiplier=2.0,
+        damage_multiplier=1.5,
+        mana_cost=30,
+    ),
+    'FIREBALL': AbilityStats(
+        name='Fireball',
+        unit_types=('MAGE',),
+        cooldown=8,
+        range=15.0,
+        radius=5.0,
+        damage=50,
+        mana_cost=50,
+    ),
+    'SHIELD_BASH': AbilityStats(
+        name='Shield Bash',
+        unit_types=('PALADIN', 'SOLDIER'),
+        cooldown=12,
+        stun_duration=2,
+        range=3.0,
+        mana_cost=20,
+    ),
+    'VOLLEY': AbilityStats(
+        name='Volley',
+        unit_types=('ARCHER',),
+        cooldown=6,
+        projectiles=5,
+        spread_angle=30,
+        mana_cost=25,
+    ),
 }
 
 # ============================================================================
@@ -412,8 +499,8 @@ GAME_RULES = {
     'RETREAT_ENABLED': True,
     'SURRENDER_ENABLED': True,
     'DIPLOMACY_ENABLED': True,
-    'DIPLOMACY_ACTIONS': ['ally', 'enemy', 'neutral', 'trade'],
-    'VICTORY_CONDITIONS': ['elimination', 'control_points', 'time_limit'],
+    'DIPLOMACY_ACTIONS': ('ally', 'enemy', 'neutral', 'trade'),
+    'VICTORY_CONDITIONS': ('elimination', 'control_points', 'time_limit'),
     'TIME_LIMIT_MINUTES': 60,
     'CONTROL_POINT_THRESHOLD': 3,  # points needed to win
 }
@@ -488,22 +575,105 @@ DIFFICULTY_SETTINGS = {
     },
 }
 
+# ============================================================================
+# PACKED COST VECTORS
+# ============================================================================
+# Fixed resource order for cost vectors, so batch affordability checks can
+# work on flat tuples instead of per-resource dict lookups
+RESOURCE_ORDER = ('gold', 'wood', 'stone', 'iron', 'food')
+
+def _cost_vector(cost):
+    """Pack a cost dict into a tuple ordered by RESOURCE_ORDER"""
+    return tuple(cost.get(resource, 0) for resource in RESOURCE_ORDER)
+
+UNIT_COST_VECTORS = {
+    unit_type: _cost_vector(stats.cost)
+    for unit_type, stats in UNIT_TYPES.items()
+}
+BUILDING_COST_VECTORS = {
+    building_type: _cost_vector(stats.cost)
+    for building_type, stats in BUILDING_TYPES.items()
+}
+
+# ============================================================================
+# FLATTENED STAT TABLES
+# ============================================================================
+# Parallel per-field tables indexed by a dense type index, for systems that
+# process many units/buildings at once (UNIT_ATTACK[i], UNIT_DEFENSE[j], ...)
+UNIT_TYPE_ORDER = tuple(UNIT_TYPES)
+UNIT_TYPE_IDX = {unit_type: i for i, unit_type in enumerate(UNIT_TYPE_ORDER)}
+
+UNIT_HEALTH = tuple(UNIT_TYPES[t].health for t in UNIT_TYPE_ORDER)
+UNIT_ATTACK = tuple(UNIT_TYPES[t].attack for t in UNIT_TYPE_ORDER)
+UNIT_DEFENSE = tuple(UNIT_TYPES[t].defense for t in UNIT_TYPE_ORDER)
+UNIT_SPEED = tuple(UNIT_TYPES[t].speed for t in UNIT_TYPE_ORDER)
+UNIT_RANGE = tuple(UNIT_TYPES[t].range for t in UNIT_TYPE_ORDER)
+UNIT_ARMOR = tuple(UNIT_TYPES[t].armor for t in UNIT_TYPE_ORDER)
+
+BUILDING_TYPE_ORDER = tuple(BUILDING_TYPES)
+BUILDING_TYPE_IDX = {
+    building_type: i for i, building_type in enumerate(BUILDING_TYPE_ORDER)
+}
+
+BUILDING_HEALTH = tuple(BUILDING_TYPES[t].health for t in BUILDING_TYPE_ORDER)
+BUILDING_DEFENSE = tuple(BUILDING_TYPES[t].defense for t in BUILDING_TYPE_ORDER)
+
+# ============================================================================
+# FROZEN CONFIGURATION
+# ============================================================================
+def _freeze(value):
+    """Recursively wrap dicts in read-only proxies with interned string keys"""
+    if isinstance(value, dict):
+        return MappingProxyType({
+            (sys.intern(key) if isinstance(key, str) else key): _freeze(item)
+            for key, item in value.items()
+        })
+    if isinstance(value, tuple) and hasattr(value, '_fields'):
+        return value._replace(**{
+            field: _freeze(item)
+            for field, item in zip(value._fields, value)
+            if isinstance(item, dict)
+        })
+    return value
+
+# Configuration tables are constants; expose them as read-only mappings so
+# accidental writes fail loudly instead of silently changing game balance
+COLORS = _freeze(COLORS)
+UNIT_TYPES = _freeze(UNIT_TYPES)
+BUILDING_TYPES = _freeze(BUILDING_TYPES)
+MAP_SETTINGS = _freeze(MAP_SETTINGS)
+BALANCE = _freeze(BALANCE)
+ABILITIES = _freeze(ABILITIES)
+GAME_RULES = _freeze(GAME_RULES)
+UI_CONFIG = _freeze(UI_CONFIG)
+AUDIO_CONFIG = _freeze(AUDIO_CONFIG)
+NETWORK_CONFIG = _freeze(NETWORK_CONFIG)
+DIFFICULTY_SETTINGS = _freeze(DIFFICULTY_SETTINGS)
+UNIT_COST_VECTORS = _freeze(UNIT_COST_VECTORS)
+BUILDING_COST_VECTORS = _freeze(BUILDING_COST_VECTORS)
+UNIT_TYPE_IDX = _freeze(UNIT_TYPE_IDX)
+BUILDING_TYPE_IDX = _freeze(BUILDING_TYPE_IDX)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=16)
 def get_unit_stats(unit_type):
     """Get stats for a specific unit type"""
     return UNIT_TYPES.get(unit_type, None)
 
+@lru_cache(maxsize=16)
 def get_building_stats(building_type):
     """Get stats for a specific building type"""
     return BUILDING_TYPES.get(building_type, None)
 
+@lru_cache(maxsize=16)
 def get_ability_stats(ability_name):
     """Get stats for a specific ability"""
     return ABILITIES.get(ability_name, None)
 
+@lru_cache(maxsize=16)
 def get_difficulty_settings(difficulty):
     """Get difficulty settings"""
     return DIFFICULTY_SETTINGS.get(difficulty, DIFFICULTY_SETTINGS['NORMAL'])
@@ -512,3 +682,12 @@ def calculate_total_cost(cost_dict, multiplier=1.0):
     """Calculate total cost with multiplier"""
     return {resource: int(amount * multiplier) 
             for resource, amount in cost_dict.items()}
+
+def calculate_total_cost_vec(cost_vec, multiplier=1.0):
+    """Calculate a packed (RESOURCE_ORDER) cost vector with multiplier"""
+    return tuple([int(amount * multiplier) for amount in cost_vec])
+
+def calculate_total_costs(cost_vecs, multiplier=1.0):
+    """Calculate many packed cost vectors with one shared multiplier"""
+    return [tuple([int(amount * multiplier) for amount in cost_vec])
+            for cost_vec in cost_vecs]
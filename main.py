@@ -6,11 +6,15 @@ Handles initialization, event processing, rendering, and game state management.
 
 import pygame
 import sys
-from enum import Enum
-from typing import Optional
+from collections import OrderedDict
+from enum import IntEnum
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
+from game_config import VSYNC_ENABLED
 
-class GameState(Enum):
+
+class GameState(IntEnum):
     """Enumeration for different game states."""
     INITIALIZING = 1
     MENU = 2
@@ -20,6 +24,28 @@ class GameState(Enum):
     QUIT = 6
 
 
+# Module-level aliases for per-frame state checks (plain global loads
+# compared as ints, instead of attribute lookups on the enum class)
+_MENU = GameState.MENU
+_PLAYING = GameState.PLAYING
+_PAUSED = GameState.PAUSED
+_GAME_OVER = GameState.GAME_OVER
+
+
+def _rasterize_grid(
+    surface: pygame.Surface, spacing: int, color: Tuple[int, int, int]
+) -> None:
+    """Write grid lines straight into a surface's pixels.
+    
+    Strided PixelArray slice assignment fills every column and row line in
+    one C-level sweep per axis instead of a Python loop of draw calls.
+    Per-pixel render routines should follow the same pattern.
+    """
+    with pygame.PixelArray(surface) as pixels:
+        pixels[::spacing, :] = color
+        pixels[:, ::spacing] = color
+
+
 class Empire3DGame:
     """Main game class managing the Empire 3D game loop."""
     
@@ -27,22 +53,50 @@ class Empire3DGame:
     WINDOW_WIDTH = 1200
     WINDOW_HEIGHT = 800
     TARGET_FPS = 60
+    DISPLAY_FLAGS = pygame.SCALED | pygame.DOUBLEBUF | pygame.HWSURFACE
+    
+    # Render colors and grid layout
+    _BG_COLOR = (20, 20, 30)  # Dark blue background
+    _GRID_COLOR = (50, 50, 70)
+    _GRID_SPACING = 50
+    _OVERLAY_COLOR = (0, 0, 0)
+    _TITLE_COLOR = (255, 200, 100)
+    _PAUSE_COLOR = (255, 100, 100)
+    _GAMEOVER_COLOR = (255, 50, 50)
+    _TEXT_COLOR = (200, 200, 200)
+    _FPS_COLOR = (100, 255, 100)
+    
+    # Anchor points for centered static text (the window size is fixed)
+    _TITLE_POS = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)
+    _CENTER_POS = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+    _ABOVE_CENTER_POS = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50)
+    _BELOW_CENTER_POS = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50)
+    
+    # Max number of distinct dynamic HUD strings kept rendered
+    HUD_TEXT_CACHE_SIZE = 128
     
     def __init__(self):
         """Initialize the game engine and window."""
         pygame.init()
         
-        # Window setup
-        self.display = pygame.display.set_mode(
-            (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
-        )
+        # Window setup (hardware-backed, page-flipped where available)
+        window_size = (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        try:
+            self.display = pygame.display.set_mode(
+                window_size, self.DISPLAY_FLAGS,
+                vsync=1 if VSYNC_ENABLED else 0
+            )
+        except pygame.error:
+            # Some drivers refuse vsync; keep the accelerated flags without it
+            self.display = pygame.display.set_mode(
+                window_size, self.DISPLAY_FLAGS
+            )
         pygame.display.set_caption("Empire 3D")
         
         # Clock for FPS management
         self.clock = pygame.time.Clock()
         self.fps = 0
-        self.frame_count = 0
-        self.fps_update_timer = 0
+        self._last_fps_sec = 0
         
         # Game state management
         self.current_state = GameState.INITIALIZING
@@ -53,16 +107,69 @@ class Empire3DGame:
         self.delta_time = 0.0
         self.total_time = 0.0
         
-        # Font for FPS display
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_large = pygame.font.Font(None, 48)
+        # Rendered text caches (static labels and dynamic HUD strings)
+        self._cached_text: Dict[str, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self._hud_text_cache: OrderedDict = OrderedDict()
+        
+        # Screen regions changed since the last present; static states
+        # only push these instead of flipping the whole frame
+        self._dirty_rects: List[pygame.Rect] = []
+        self._prev_dirty_rects: List[pygame.Rect] = []
+        self._presented_state: Optional[GameState] = None
         
-        # Initialize game modules (placeholder for future game systems)
-        self._initialize_game_systems()
+        # Static screens are only redrawn after input (or a state change)
+        self._needs_redraw = True
+        
+        # Static background grid, rasterized on first use
+        self._grid_surface: Optional[pygame.Surface] = None
+        
+        # Only queue the event types the game actually consumes
+        self._event_dispatch = {
+            pygame.QUIT: self._handle_quit,
+            pygame.KEYDOWN: self._handle_key_down,
+            pygame.KEYUP: self._handle_key_up,
+            pygame.MOUSEBUTTONDOWN: self._handle_mouse_down,
+            pygame.MOUSEBUTTONUP: self._handle_mouse_up,
+            pygame.MOUSEMOTION: self._handle_mouse_motion,
+            pygame.WINDOWEXPOSED: self._handle_window_exposed,
+        }
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self._event_dispatch))
+        
+        # Game modules are initialized on the first MENU -> PLAYING transition
+        self._systems_initialized = False
         
         # Set initial state
         self.current_state = GameState.MENU
     
+    @cached_property
+    def font_small(self) -> pygame.font.Font:
+        """Small UI font, loaded on first use."""
+        return pygame.font.Font(None, 24)
+    
+    @cached_property
+    def font_large(self) -> pygame.font.Font:
+        """Large title font, loaded on first use."""
+        return pygame.font.Font(None, 48)
+    
+    @cached_property
+    def _pause_overlay(self) -> pygame.Surface:
+        """Overlay dimming the game world while paused."""
+        return self._build_overlay(128)
+    
+    @cached_property
+    def _gameover_overlay(self) -> pygame.Surface:
+        """Overlay dimming the game world on the game over screen."""
+        return self._build_overlay(200)
+    
+    def _enter_playing(self) -> None:
+        """Start playing, initializing game systems on first entry."""
+        if not self._systems_initialized:
+            self._initialize_game_systems()
+            self._systems_initialized = True
+        self.current_state = GameState.PLAYING
+        self.is_paused = False
+    
     def _initialize_game_systems(self) -> None:
         """Initialize all game systems and modules."""
         # TODO: Import and initialize game modules
@@ -75,44 +182,58 @@ class Empire3DGame:
     
     def handle_events(self) -> None:
         """Handle all input events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.current_state = GameState.QUIT
-                self.running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                self._handle_key_down(event)
-            
-            elif event.type == pygame.KEYUP:
-                self._handle_key_up(event)
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_mouse_down(event)
-            
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self._handle_mouse_up(event)
-            
-            elif event.type == pygame.MOUSEMOTION:
-                self._handle_mouse_motion(event)
-    
-    def _handle_key_down(self, event: pygame.event.Event) -> None:
-        """Handle key press events."""
-        if event.key == pygame.K_ESCAPE:
-            if self.current_state == GameState.PLAYING:
-                self.current_state = GameState.PAUSED
+        dispatch = self._event_dispatch
+        events = pygame.event.get()
+        if events:
+            self._needs_redraw = True
+        for event in events:
+            handler = dispatch.get(event.type)
+            if handler is not None:
+                handler(event)
+    
+    def _handle_quit(self, event: pygame.event.Event) -> None:
+        """Handle window close requests."""
+        self.current_state = GameState.QUIT
+        self.running = False
+    
+    def _handle_window_exposed(self, event: pygame.event.Event) -> None:
+        """Force a full present after the window contents were lost."""
+        self._presented_state = None
+    
+    def _handle_key_down(
+        self, event: pygame.event.Event,
+        _ESCAPE: int = pygame.K_ESCAPE, _F1: int = pygame.K_F1,
+        _MENU: GameState = GameState.MENU,
+        _PLAYING: GameState = GameState.PLAYING,
+        _PAUSED: GameState = GameState.PAUSED
+    ) -> None:
+        """Handle key press events.
+        
+        Key codes and states are bound as default arguments so lookups in
+        this handler (which runs on every key repeat) are local loads.
+        """
+        key = event.key
+        if key == _ESCAPE:
+            if self.current_state == _PLAYING:
+                self.current_state = _PAUSED
                 self.is_paused = True
-            elif self.current_state == GameState.PAUSED:
-                self.current_state = GameState.PLAYING
+            elif self.current_state == _PAUSED:
+                self.current_state = _PLAYING
                 self.is_paused = False
             else:
                 self.running = False
         
-        elif event.key == pygame.K_F1:
+        elif self.current_state == _MENU:
+            # Any other key starts the game from the main menu
+            self._enter_playing()
+            return
+        
+        elif key == _F1:
             # Debug key - placeholder
             pass
         
         # Game-specific key handling
-        if self.current_state == GameState.PLAYING:
+        if self.current_state == _PLAYING:
             # TODO: Add game-specific input handling
             # - Camera movement (WASD)
             # - Unit selection/commands
@@ -148,7 +269,8 @@ class Empire3DGame:
         self.delta_time = delta_time
         self.total_time += delta_time
         
-        if self.current_state == GameState.PLAYING and not self.is_paused:
+        state = self.current_state
+        if state == _PLAYING and not self.is_paused:
             # TODO: Update game systems
             # - Update entity positions
             # - Update AI logic
@@ -157,58 +279,64 @@ class Empire3DGame:
             # - Check win/lose conditions
             pass
         
-        elif self.current_state == GameState.MENU:
+        elif state == _MENU:
             # TODO: Update menu logic
             pass
         
-        elif self.current_state == GameState.PAUSED:
+        elif state == _PAUSED:
             # Game is paused - minimal updates
             pass
         
-        elif self.current_state == GameState.GAME_OVER:
+        elif state == _GAME_OVER:
             # TODO: Handle game over state
             pass
     
     def render(self) -> None:
         """Render the game frame."""
         # Clear screen
-        self.display.fill((20, 20, 30))  # Dark blue background
+        self.display.fill(self._BG_COLOR)
         
         # Render based on game state
-        if self.current_state == GameState.MENU:
+        state = self.current_state
+        if state == _MENU:
             self._render_menu()
         
-        elif self.current_state == GameState.PLAYING:
+        elif state == _PLAYING:
             self._render_game()
         
-        elif self.current_state == GameState.PAUSED:
+        elif state == _PAUSED:
             self._render_game()  # Render game underneath
             self._render_pause_overlay()
         
-        elif self.current_state == GameState.GAME_OVER:
+        elif state == _GAME_OVER:
             self._render_game_over()
         
         # Always render HUD elements
         self._render_hud()
         
-        # Update display
-        pygame.display.flip()
+        # Update display: full flip while the world moves or right after a
+        # state change, otherwise only the regions redrawn this frame and
+        # last frame (so shrinking text gets cleared)
+        if state == _PLAYING or state != self._presented_state:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._prev_dirty_rects + self._dirty_rects)
+        self._presented_state = state
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
     
     def _render_menu(self) -> None:
         """Render main menu screen."""
-        title_text = self.font_large.render(
-            "Empire 3D", True, (255, 200, 100)
-        )
-        title_rect = title_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 3)
+        title_text, title_rect = self._text(
+            "menu_title", "Empire 3D", self.font_large, self._TITLE_COLOR,
+            self._TITLE_POS
         )
         self.display.blit(title_text, title_rect)
         
-        start_text = self.font_small.render(
-            "Press any key to start or ESCAPE to quit", True, (200, 200, 200)
-        )
-        start_rect = start_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2)
+        start_text, start_rect = self._text(
+            "menu_start", "Press any key to start or ESCAPE to quit",
+            self.font_small, self._TEXT_COLOR,
+            self._CENTER_POS
         )
         self.display.blit(start_text, start_rect)
     
@@ -222,72 +350,107 @@ class Empire3DGame:
         # - Render build previews
         
         # Placeholder: render grid pattern
-        grid_color = (50, 50, 70)
-        grid_spacing = 50
-        
-        for x in range(0, self.WINDOW_WIDTH, grid_spacing):
-            pygame.draw.line(
-                self.display, grid_color,
-                (x, 0), (x, self.WINDOW_HEIGHT)
-            )
-        
-        for y in range(0, self.WINDOW_HEIGHT, grid_spacing):
-            pygame.draw.line(
-                self.display, grid_color,
-                (0, y), (self.WINDOW_WIDTH, y)
-            )
+        if self._grid_surface is None:
+            self._grid_surface = self._build_grid_surface()
+        self.display.blit(self._grid_surface, (0, 0))
+    
+    def _build_grid_surface(self) -> pygame.Surface:
+        """Rasterize the static background grid into a reusable surface."""
+        surface = pygame.Surface(
+            (self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.SRCALPHA
+        )
+        _rasterize_grid(surface, self._GRID_SPACING, self._GRID_COLOR)
+        return surface.convert_alpha()
+    
+    def _build_overlay(self, alpha: int) -> pygame.Surface:
+        """Create a full-screen black overlay with the given alpha."""
+        overlay = pygame.Surface(
+            (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        ).convert()
+        overlay.set_alpha(alpha)
+        overlay.fill(self._OVERLAY_COLOR)
+        return overlay
     
     def _render_pause_overlay(self) -> None:
         """Render pause menu overlay."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.display.blit(overlay, (0, 0))
+        self.display.blit(self._pause_overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, (255, 100, 100))
-        pause_rect = pause_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2)
+        pause_text, pause_rect = self._text(
+            "pause_title", "PAUSED", self.font_large, self._PAUSE_COLOR,
+            self._CENTER_POS
         )
         self.display.blit(pause_text, pause_rect)
         
         # Resume instructions
-        resume_text = self.font_small.render(
-            "Press ESC to resume", True, (200, 200, 200)
-        )
-        resume_rect = resume_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 + 50)
+        resume_text, resume_rect = self._text(
+            "pause_resume", "Press ESC to resume",
+            self.font_small, self._TEXT_COLOR,
+            self._BELOW_CENTER_POS
         )
         self.display.blit(resume_text, resume_rect)
     
     def _render_game_over(self) -> None:
         """Render game over screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.display.blit(overlay, (0, 0))
+        self.display.blit(self._gameover_overlay, (0, 0))
         
         # Game Over text
-        gameover_text = self.font_large.render(
-            "GAME OVER", True, (255, 50, 50)
-        )
-        gameover_rect = gameover_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 - 50)
+        gameover_text, gameover_rect = self._text(
+            "gameover_title", "GAME OVER", self.font_large,
+            self._GAMEOVER_COLOR,
+            self._ABOVE_CENTER_POS
         )
         self.display.blit(gameover_text, gameover_rect)
         
         # Restart instructions
-        restart_text = self.font_small.render(
+        restart_text, restart_rect = self._text(
+            "gameover_restart",
             "Press any key to return to menu or ESCAPE to quit",
-            True, (200, 200, 200)
-        )
-        restart_rect = restart_text.get_rect(
-            center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 + 50)
+            self.font_small, self._TEXT_COLOR,
+            self._BELOW_CENTER_POS
         )
         self.display.blit(restart_text, restart_rect)
     
+    def _text(
+        self, key: str, text: str, font: pygame.font.Font,
+        color: Tuple[int, int, int], center: Tuple[int, int]
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Return a static text surface and its centered rect.
+        
+        Both are computed on first use; the window size is fixed, so the
+        cached rect stays valid for the lifetime of the game.
+        """
+        cached = self._cached_text.get(key)
+        if cached is None:
+            surface = font.render(text, True, color).convert_alpha()
+            cached = (surface, surface.get_rect(center=center))
+            self._cached_text[key] = cached
+        return cached
+    
+    def _hud_text(
+        self, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Return a rendered HUD string, cached by its formatted value.
+        
+        The cache is a bounded LRU: strings that repeat across frames (the
+        time only changes every 100 ms) reuse their surface, and the least
+        recently drawn strings are evicted once the cache is full.
+        """
+        cache = self._hud_text_cache
+        key = (text, color)
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        surface = self.font_small.render(text, True, color).convert_alpha()
+        cache[key] = surface
+        if len(cache) > self.HUD_TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+    
     def _render_hud(self) -> None:
         """Render heads-up display (HUD) elements."""
         self._render_fps_counter()
@@ -295,10 +458,8 @@ class Empire3DGame:
     
     def _render_fps_counter(self) -> None:
         """Render FPS counter in top-left corner."""
-        fps_text = self.font_small.render(
-            f"FPS: {self.fps}", True, (100, 255, 100)
-        )
-        self.display.blit(fps_text, (10, 10))
+        fps_text = self._hud_text(f"FPS: {self.fps}", self._FPS_COLOR)
+        self._dirty_rects.append(self.display.blit(fps_text, (10, 10)))
     
     def _render_game_info(self) -> None:
         """Render game information on HUD."""
@@ -309,21 +470,18 @@ class Empire3DGame:
         
         y_offset = 40
         for text_str in info_texts:
-            text_surface = self.font_small.render(
-                text_str, True, (200, 200, 200)
+            text_surface = self._hud_text(text_str, self._TEXT_COLOR)
+            self._dirty_rects.append(
+                self.display.blit(text_surface, (10, y_offset))
             )
-            self.display.blit(text_surface, (10, y_offset))
             y_offset += 25
     
     def _update_fps(self) -> None:
-        """Update FPS counter."""
-        self.frame_count += 1
-        self.fps_update_timer += self.delta_time
-        
-        if self.fps_update_timer >= 1.0:
-            self.fps = self.frame_count
-            self.frame_count = 0
-            self.fps_update_timer = 0.0
+        """Refresh the FPS counter from the clock once per second."""
+        second = int(self.total_time)
+        if second != self._last_fps_sec:
+            self.fps = int(self.clock.get_fps())
+            self._last_fps_sec = second
     
     def run(self) -> None:
         """Main game loop."""
@@ -344,8 +502,12 @@ class Empire3DGame:
             # Update game logic
             self.update(delta_time)
             
-            # Render frame
-            self.render()
+            # Render frame (static screens only when something changed)
+            state = self.current_state
+            if (self._needs_redraw or state == _PLAYING
+                    or state != self._presented_state):
+                self.render()
+                self._needs_redraw = False
         
         self.shutdown()
     
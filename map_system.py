@@ -5,9 +5,13 @@ and resource placement on the game map.
 """
 
 import heapq
+import math
 import random
+from array import array
+from bisect import bisect_right
 from enum import Enum
-from typing import List, Tuple, Optional, Dict, Set
+from functools import lru_cache
+from typing import Callable, List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 
 
@@ -19,6 +23,14 @@ class TileType(Enum):
     MOUNTAIN = 4
 
 
+# Raw tile type codes stored in the map grids; hot paths compare these
+# plain ints instead of TileType members
+GRASS = TileType.GRASS.value
+WATER = TileType.WATER.value
+FOREST = TileType.FOREST.value
+MOUNTAIN = TileType.MOUNTAIN.value
+
+
 class ResourceType(Enum):
     """Enumeration of different resource types."""
     WOOD = "wood"
@@ -27,9 +39,47 @@ class ResourceType(Enum):
     FOOD = "food"
 
 
-@dataclass
+# Dense lookup tables between the enums and the codes stored in the map grids
+_TILE_TYPE_BY_CODE: Tuple[Optional[TileType], ...] = (
+    None, TileType.GRASS, TileType.WATER, TileType.FOREST, TileType.MOUNTAIN,
+)
+_RESOURCE_BY_CODE: Tuple[Optional[ResourceType], ...] = (
+    None, ResourceType.WOOD, ResourceType.STONE, ResourceType.GOLD, ResourceType.FOOD,
+)
+_RESOURCE_CODES: Dict[ResourceType, int] = {
+    resource_type: code for code, resource_type in enumerate(_RESOURCE_BY_CODE)
+    if resource_type is not None
+}
+
+# Movement cost multiplier for diagonal steps
+DIAG = math.sqrt(2)
+# (dx, dy) offsets of the 8 neighbors of a tile (including diagonals)
+_NEIGHBOR_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1),
+)
+# Extra cost of a diagonal step over a straight one (octile heuristic)
+_DIAG_EXTRA = DIAG - 1
+
+
+def _octile_distance(dx: int, dy: int) -> float:
+    """Cheapest 8-connected distance over unit-cost tiles for an offset of (dx, dy)."""
+    dx, dy = abs(dx), abs(dy)
+    if dx < dy:
+        dx, dy = dy, dx
+    return dx + _DIAG_EXTRA * dy
+
+
+@dataclass(slots=True)
 class Tile:
-    """Represents a single tile on the game map."""
+    """
+    Represents a single tile on the game map.
+
+    Tiles returned by GameMap are snapshots built from the map's grids;
+    use GameMap methods (set_tile, set_walkable, place_resource, ...) to
+    modify the map.
+    """
     x: int
     y: int
     tile_type: TileType
@@ -46,29 +96,115 @@ class Tile:
         return False
 
 
-@dataclass
-class PathNode:
-    """Node used for A* pathfinding."""
-    tile: Tile
-    g_cost: float = 0.0  # Cost from start
-    h_cost: float = 0.0  # Heuristic cost to goal
-    parent: Optional['PathNode'] = None
+@lru_cache(maxsize=None)
+def _astar_kernel(width: int, height: int) -> Callable[[array, int, int], Optional[List[int]]]:
+    """
+    Build an A* search specialized to one map size.
+
+    The returned function searches the flat map grids by flat index
+    (y * width + x), with g costs, parents and the closed set held in flat
+    per-tile buffers so no per-node objects are allocated while exploring.
+    The map size, the flat index delta and cost factor of each neighbor
+    step are bound into its closure, so the inner loop neither recomputes
+    indices nor branches on diagonals. Kernels are cached per map size.
+
+    Args:
+        width: Width of the map in tiles
+        height: Height of the map in tiles
+
+    Returns:
+        Function taking (cost_grid, start, goal) flat indices and returning
+        the list of flat indices from start to goal, or None if no path exists
+    """
+    size = width * height
+    inf = float('inf')
+    diag_extra = _DIAG_EXTRA
+    # (dx, dy, flat index delta, movement cost factor) per neighbor;
+    # diagonal movement costs more
+    steps = tuple((dx, dy, dy * width + dx, DIAG if dx and dy else 1.0)
+                  for dx, dy in _NEIGHBOR_OFFSETS)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    heappushpop = heapq.heappushpop
+
+    def astar(cost_grid: array, start: int, goal: int) -> Optional[List[int]]:
+        g_cost = [inf] * size
+        parent = array('i', [-1]) * size
+        closed = bytearray(size)
+        goal_x, goal_y = goal % width, goal // width
+
+        start_x, start_y = start % width, start // width
+        g_cost[start] = 0.0
+        start_entry = (_octile_distance(start_x - goal_x, start_y - goal_y), start)
+        open_set: List[Tuple[float, int]] = []
+        open_entries: Dict[int, Tuple[float, int]] = {start: start_entry}
+        # The latest entry is held back from the heap so it can be pushed
+        # and the next node popped in one heappushpop, which skips the heap
+        # entirely when that entry is already the cheapest
+        pending: Optional[Tuple[float, int]] = start_entry
+
+        while open_set or pending is not None:
+            if pending is None:
+                entry = heappop(open_set)
+            else:
+                entry = heappushpop(open_set, pending)
+                pending = None
+            current = entry[1]
+            if open_entries.get(current) is not entry:
+                continue  # Stale entry superseded by a cheaper one
+            del open_entries[current]
+
+            if current == goal:
+                # Reconstruct path by walking the parent links back to start
+                path = []
+                while current != -1:
+                    path.append(current)
+                    current = parent[current]
+                path.reverse()
+                return path
+
+            closed[current] = 1
+            current_x, current_y = current % width, current // width
+            current_g = g_cost[current]
+
+            # 8-directional movement (including diagonals)
+            for dx, dy, delta, factor in steps:
+                x, y = current_x + dx, current_y + dy
+                if not (0 <= x < width and 0 <= y < height):
+                    continue
+                neighbor = current + delta
+                if closed[neighbor]:
+                    continue
+
+                move_cost = cost_grid[neighbor]
+                if move_cost == inf:
+                    continue
 
-    @property
-    def f_cost(self) -> float:
-        """Total estimated cost."""
-        return self.g_cost + self.h_cost
+                # Only keep the neighbor if we've found a better path; an
+                # improved open tile gets a fresh entry and the old one is
+                # skipped when popped (lazy deletion)
+                new_g_cost = current_g + move_cost * factor
+                if new_g_cost >= g_cost[neighbor]:
+                    continue
 
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
+                g_cost[neighbor] = new_g_cost
+                parent[neighbor] = current
+                # Octile distance to the goal, inlined
+                h_dx = x - goal_x if x > goal_x else goal_x - x
+                h_dy = y - goal_y if y > goal_y else goal_y - y
+                if h_dx > h_dy:
+                    h_cost = h_dx + diag_extra * h_dy
+                else:
+                    h_cost = h_dy + diag_extra * h_dx
+                entry = (new_g_cost + h_cost, neighbor)
+                if pending is not None:
+                    heappush(open_set, pending)
+                pending = entry
+                open_entries[neighbor] = entry
 
-    def __eq__(self, other):
-        if isinstance(other, PathNode):
-            return self.tile == other.tile
-        return False
+        return None
 
-    def __hash__(self):
-        return hash(self.tile)
+    return astar
 
 
 class GameMap:
@@ -85,6 +221,18 @@ class GameMap:
         TileType.WATER: float('inf'),  # Not walkable by default
     }
 
+    # Share of the map covered by each terrain band, from the lowest
+    # elevation to the highest
+    TERRAIN_BANDS = (
+        (TileType.WATER, 0.08),
+        (TileType.GRASS, 0.70),
+        (TileType.FOREST, 0.14),
+        (TileType.MOUNTAIN, 0.08),
+    )
+
+    # Falloff of the random displacement per diamond-square subdivision
+    TERRAIN_ROUGHNESS = 0.55
+
     # Resource spawn probabilities by tile type
     RESOURCE_SPAWN_RATES = {
         TileType.GRASS: {ResourceType.FOOD: 0.15},
@@ -104,112 +252,161 @@ class GameMap:
         """
         self.width = width
         self.height = height
-        self.tiles: Dict[Tuple[int, int], Tile] = {}
-        self.resources_placed: Dict[Tuple[int, int], Tuple[ResourceType, int]] = {}
 
-        if seed is not None:
-            random.seed(seed)
+        # Tile data is stored as flat structure-of-arrays grids indexed by
+        # y * width + x, holding TileType values and resource codes
+        size = width * height
+        self.tile_type = bytearray([GRASS]) * size
+        self.resource = bytearray(size)  # 0 = no resource
+        self.resource_amount = array('i', [0]) * size
+        self.walkable = bytearray([1]) * size
+        # Keyed by flat tile index (y * width + x)
+        self.resources_placed: Dict[int, Tuple[ResourceType, int]] = {}
+
+        # Dedicated generator so map generation neither depends on nor
+        # disturbs the global random state
+        self._rng = random.Random(seed)
+
+        # Pathfinding kernel specialized to this map's size
+        self._astar = _astar_kernel(width, height)
 
         self._generate_terrain()
 
     def _generate_terrain(self) -> None:
         """Generate the initial terrain using noise-based generation."""
-        # Initialize all tiles as grass
-        for x in range(self.width):
-            for y in range(self.height):
-                self.tiles[(x, y)] = Tile(x, y, TileType.GRASS)
-
-        # Add water bodies (simplified island generation)
-        self._generate_water()
-
-        # Add forests
-        self._generate_forests()
-
-        # Add mountains
-        self._generate_mountains()
+        heights = self._generate_heightmap()
+
+        # Elevation thresholds at the cumulative band shares, so each band
+        # covers its share of the map whatever the noise range
+        ordered = sorted(heights)
+        size = len(ordered)
+        thresholds = []
+        share = 0.0
+        for _, band_share in self.TERRAIN_BANDS[:-1]:
+            share += band_share
+            thresholds.append(ordered[min(size - 1, int(share * size))])
+        codes = [tile_type.value for tile_type, _ in self.TERRAIN_BANDS]
+
+        # Classify every tile in a single pass
+        self.tile_type[:] = bytearray(codes[bisect_right(thresholds, height)]
+                                      for height in heights)
 
         # Place resources
         self._place_resources()
 
-    def _generate_water(self) -> None:
-        """Generate water bodies on the map."""
-        # Create a few water clusters
-        num_water_clusters = random.randint(3, 6)
-        for _ in range(num_water_clusters):
-            center_x = random.randint(0, self.width - 1)
-            center_y = random.randint(0, self.height - 1)
-            cluster_size = random.randint(5, 15)
-            self._create_terrain_cluster(center_x, center_y, cluster_size, TileType.WATER)
-
-    def _generate_forests(self) -> None:
-        """Generate forest areas on the map."""
-        num_forest_clusters = random.randint(5, 10)
-        for _ in range(num_forest_clusters):
-            center_x = random.randint(0, self.width - 1)
-            center_y = random.randint(0, self.height - 1)
-            cluster_size = random.randint(8, 20)
-            self._create_terrain_cluster(center_x, center_y, cluster_size, TileType.FOREST)
-
-    def _generate_mountains(self) -> None:
-        """Generate mountain ranges on the map."""
-        num_mountain_clusters = random.randint(3, 6)
-        for _ in range(num_mountain_clusters):
-            center_x = random.randint(0, self.width - 1)
-            center_y = random.randint(0, self.height - 1)
-            cluster_size = random.randint(6, 15)
-            self._create_terrain_cluster(center_x, center_y, cluster_size, TileType.MOUNTAIN)
-
-    def _create_terrain_cluster(self, center_x: int, center_y: int,
-                                size: int, tile_type: TileType) -> None:
-        """
-        Create a cluster of terrain tiles.
-
-        Args:
-            center_x: X coordinate of cluster center
-            center_y: Y coordinate of cluster center
-            size: Size of the cluster
-            tile_type: Type of terrain to create
-        """
-        created = 0
-        queue = [(center_x, center_y)]
-        visited = set()
+        self._build_cost_grid()
 
-        while queue and created < size:
-            try:
-                x, y = queue.pop(0)
+        # Running tile/resource counts, kept up to date by set_tile,
+        # place_resource and harvest_resource (bytearray.count runs in C)
+        self._tile_counts: Dict[TileType, int] = {
+            tile_type: self.tile_type.count(tile_type.value) for tile_type in TileType
+        }
+        self._resource_counts: Dict[ResourceType, int] = {
+            resource_type: self.resource.count(code)
+            for resource_type, code in _RESOURCE_CODES.items()
+        }
 
-                if (x, y) in visited:
-                    continue
-                if not (0 <= x < self.width and 0 <= y < self.height):
-                    continue
+    def _build_cost_grid(self) -> None:
+        """Precompute the per-tile movement cost grid read by the pathfinder."""
+        tile_costs = [1.0] * len(_TILE_TYPE_BY_CODE)
+        for tile_type, cost in self.TILE_COSTS.items():
+            tile_costs[tile_type.value] = cost
+        self._tile_costs = tile_costs
 
-                visited.add((x, y))
+        inf = float('inf')
+        self._cost_grid = array('d', [
+            tile_costs[code] if walkable else inf
+            for code, walkable in zip(self.tile_type, self.walkable)
+        ])
 
-                # Don't overwrite water with other terrain (water is priority)
-                if self.tiles[(x, y)].tile_type != TileType.WATER or tile_type == TileType.WATER:
-                    self.tiles[(x, y)] = Tile(x, y, tile_type)
-                    created += 1
+    def _generate_heightmap(self) -> List[float]:
+        """
+        Generate a diamond-square heightmap covering the map.
 
-                # Add neighboring tiles with some probability
-                if random.random() < 0.6:
-                    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                        nx, ny = x + dx, y + dy
-                        if (nx, ny) not in visited:
-                            queue.append((nx, ny))
-            except (IndexError, KeyError):
-                continue
+        Returns:
+            Elevations in row-major order, indexed like the map grids
+        """
+        rand = self._rng.random
+
+        # Diamond-square works on a square grid of side 2^n + 1; generate
+        # the smallest one covering the map and crop it
+        span = 1
+        while span < max(self.width, self.height) - 1:
+            span *= 2
+        side = span + 1
+        heights = [0.0] * (side * side)
+        for corner in (0, span, span * side, span * side + span):
+            heights[corner] = rand()
+
+        step = span
+        scale = 1.0
+        while step > 1:
+            half = step // 2
+            offset = half * side
+
+            # Diamond step: the centre of each square from its four corners
+            for y in range(half, side, step):
+                row = y * side
+                for index in range(row + half, row + side, step):
+                    heights[index] = (heights[index - offset - half]
+                                      + heights[index - offset + half]
+                                      + heights[index + offset - half]
+                                      + heights[index + offset + half]) * 0.25 \
+                        + (rand() - 0.5) * scale
+
+            # Square step: each edge midpoint from its (up to) four neighbors
+            for y in range(0, side, half):
+                row = y * side
+                for x in range((y + half) % step, side, step):
+                    index = row + x
+                    total = 0.0
+                    count = 0
+                    if y >= half:
+                        total += heights[index - offset]
+                        count += 1
+                    if y + half < side:
+                        total += heights[index + offset]
+                        count += 1
+                    if x >= half:
+                        total += heights[index - half]
+                        count += 1
+                    if x + half < side:
+                        total += heights[index + half]
+                        count += 1
+                    heights[index] = total / count + (rand() - 0.5) * scale
+
+            step = half
+            scale *= self.TERRAIN_ROUGHNESS
+
+        width = self.width
+        return [height for y in range(self.height)
+                for height in heights[y * side:y * side + width]]
 
     def _place_resources(self) -> None:
         """Place resources on the map based on tile types."""
-        for tile in self.tiles.values():
-            if tile.tile_type == TileType.WATER:
-                continue
-
-            spawn_rates = self.RESOURCE_SPAWN_RATES.get(tile.tile_type, {})
-            for resource_type, spawn_rate in spawn_rates.items():
-                if random.random() < spawn_rate:
-                    amount = random.randint(5, 20)
-                    self.place_resource(tile.x, tile.y, resource_type, amount)
+        # Spawn entries indexed by tile type code; water never gets resources
+        spawn_table: List[Tuple[Tuple[ResourceType, int, float], ...]] = [()] * len(_TILE_TYPE_BY_CODE)
+        for tile_type, spawn_rates in self.RESOURCE_SPAWN_RATES.items():
+            if tile_type != TileType.WATER:
+                spawn_table[tile_type.value] = tuple(
+                    (resource_type, _RESOURCE_CODES[resource_type], spawn_rate)
+                    for resource_type, spawn_rate in spawn_rates.items()
+                )
+
+        # Single pass over the type grid writing straight into the resource
+        # grids, with the RNG and grids bound to locals
+        resources = self.resource
+        amounts = self.resource_amount
+        placed = self.resources_placed
+        rand = self._rng.random
+        randint = self._rng.randint
+        for index, code in enumerate(self.tile_type):
+            for resource_type, resource_code, spawn_rate in spawn_table[code]:
+                if rand() < spawn_rate:
+                    amount = randint(5, 20)
+                    resources[index] = resource_code
+                    amounts[index] = amount
+                    placed[index] = (resource_type, amount)
 
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """
@@ -224,7 +421,17 @@ class GameMap:
         """
         if not (0 <= x < self.width and 0 <= y < self.height):
             return None
-        return self.tiles.get((x, y))
+        return self._build_tile(x, y, y * self.width + x)
+
+    def _build_tile(self, x: int, y: int, index: int) -> Tile:
+        """Build a Tile snapshot from the grids at a flat index."""
+        return Tile(
+            x, y,
+            _TILE_TYPE_BY_CODE[self.tile_type[index]],
+            _RESOURCE_BY_CODE[self.resource[index]],
+            self.resource_amount[index],
+            bool(self.walkable[index]),
+        )
 
     def set_tile(self, x: int, y: int, tile_type: TileType) -> bool:
         """
@@ -241,7 +448,43 @@ class GameMap:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
 
-        self.tiles[(x, y)] = Tile(x, y, tile_type)
+        # A fresh tile: new terrain, no resource, walkable
+        index = y * self.width + x
+        self._tile_counts[_TILE_TYPE_BY_CODE[self.tile_type[index]]] -= 1
+        self._tile_counts[tile_type] += 1
+        old_resource = _RESOURCE_BY_CODE[self.resource[index]]
+        if old_resource:
+            self._resource_counts[old_resource] -= 1
+
+        self.tile_type[index] = tile_type.value
+        self.resource[index] = 0
+        self.resource_amount[index] = 0
+        self.walkable[index] = 1
+        self._cost_grid[index] = self._tile_costs[tile_type.value]
+        self.resources_placed.pop(index, None)
+        return True
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> bool:
+        """
+        Mark a tile as walkable or blocked.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            walkable: Whether units may enter the tile
+
+        Returns:
+            True if successful, False if coordinates are out of bounds
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+
+        # Keep the pathfinder's cost grid in step with the walkable grid
+        index = y * self.width + x
+        self.walkable[index] = 1 if walkable else 0
+        self._cost_grid[index] = (
+            self._tile_costs[self.tile_type[index]] if walkable else float('inf')
+        )
         return True
 
     def place_resource(self, x: int, y: int, resource_type: ResourceType,
@@ -258,13 +501,20 @@ class GameMap:
         Returns:
             True if successful, False if tile doesn't exist or is water
         """
-        tile = self.get_tile(x, y)
-        if not tile or tile.tile_type == TileType.WATER:
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return False
+        index = y * self.width + x
+        if self.tile_type[index] == WATER:
+            return False
+
+        old_resource = _RESOURCE_BY_CODE[self.resource[index]]
+        if old_resource:
+            self._resource_counts[old_resource] -= 1
+        self._resource_counts[resource_type] += 1
 
-        tile.resource = resource_type
-        tile.resource_amount = amount
-        self.resources_placed[(x, y)] = (resource_type, amount)
+        self.resource[index] = _RESOURCE_CODES[resource_type]
+        self.resource_amount[index] = amount
+        self.resources_placed[index] = (resource_type, amount)
         return True
 
     def harvest_resource(self, x: int, y: int, amount: int) -> Optional[Tuple[ResourceType, int]]:
@@ -279,19 +529,22 @@ class GameMap:
         Returns:
             Tuple of (ResourceType, amount harvested) or None if no resource
         """
-        tile = self.get_tile(x, y)
-        if not tile or not tile.resource:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        index = y * self.width + x
+        resource_type = _RESOURCE_BY_CODE[self.resource[index]]
+        if not resource_type:
             return None
 
-        harvested = min(amount, tile.resource_amount)
-        tile.resource_amount -= harvested
+        harvested = min(amount, self.resource_amount[index])
+        self.resource_amount[index] -= harvested
 
-        if tile.resource_amount <= 0:
-            tile.resource = None
-            if (x, y) in self.resources_placed:
-                del self.resources_placed[(x, y)]
+        if self.resource_amount[index] <= 0:
+            self.resource[index] = 0
+            self._resource_counts[resource_type] -= 1
+            self.resources_placed.pop(index, None)
 
-        return (tile.resource, harvested)
+        return (resource_type, harvested)
 
     def get_neighbors(self, tile: Tile) -> List[Tile]:
         """
@@ -304,21 +557,25 @@ class GameMap:
             List of neighboring Tile objects
         """
         neighbors = []
+        width, height = self.width, self.height
+        walkable = self.walkable
         # 8-directional movement (including diagonals)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-
-                neighbor = self.get_tile(tile.x + dx, tile.y + dy)
-                if neighbor and neighbor.walkable:
-                    neighbors.append(neighbor)
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            x, y = tile.x + dx, tile.y + dy
+            if 0 <= x < width and 0 <= y < height:
+                index = y * width + x
+                if walkable[index]:
+                    neighbors.append(self._build_tile(x, y, index))
 
         return neighbors
 
     def heuristic(self, tile1: Tile, tile2: Tile) -> float:
         """
-        Calculate heuristic distance between two tiles (Euclidean distance).
+        Calculate heuristic distance between two tiles (octile distance).
+
+        Octile distance is the exact cost of the cheapest 8-connected route
+        over grass, matching the movement cost model, so it never
+        overestimates while staying tighter than Euclidean distance.
 
         Args:
             tile1: First tile
@@ -327,9 +584,7 @@ class GameMap:
         Returns:
             Estimated distance between tiles
         """
-        dx = abs(tile1.x - tile2.x)
-        dy = abs(tile1.y - tile2.y)
-        return (dx ** 2 + dy ** 2) ** 0.5
+        return _octile_distance(tile1.x - tile2.x, tile1.y - tile2.y)
 
     def get_movement_cost(self, from_tile: Tile, to_tile: Tile) -> float:
         """
@@ -351,7 +606,7 @@ class GameMap:
         is_diagonal = dx == 1 and dy == 1
 
         base_cost = self.TILE_COSTS.get(to_tile.tile_type, 1.0)
-        return base_cost * (1.414 if is_diagonal else 1.0)
+        return base_cost * (DIAG if is_diagonal else 1.0)
 
     def find_path(self, start: Tile, goal: Tile) -> Optional[List[Tile]]:
         """
@@ -364,59 +619,61 @@ class GameMap:
         Returns:
             List of tiles representing the path, or None if no path exists
         """
+        width, height = self.width, self.height
+        if not (0 <= start.x < width and 0 <= start.y < height
+                and 0 <= goal.x < width and 0 <= goal.y < height):
+            return None
         if not start.walkable or not goal.walkable:
             return None
 
-        open_set: List[PathNode] = []
-        closed_set: Set[PathNode] = set()
-        open_dict: Dict[Tuple[int, int], PathNode] = {}
-
-        start_node = PathNode(start, 0.0, self.heuristic(start, goal))
-        heapq.heappush(open_set, start_node)
-        open_dict[(start.x, start.y)] = start_node
-
-        while open_set:
-            current_node = heapq.heappop(open_set)
-            del open_dict[(current_node.tile.x, current_node.tile.y)]
-
-            if current_node.tile == goal:
-                # Reconstruct path
-                path = []
-                node = current_node
-                while node is not None:
-                    path.append(node.tile)
-                    node = node.parent
-                return list(reversed(path))
-
-            closed_set.add(current_node)
+        path = self._astar(self._cost_grid, start.y * width + start.x,
+                           goal.y * width + goal.x)
+        if path is None:
+            return None  # No path found
+        return [self._build_tile(index % width, index // width, index) for index in path]
 
-            for neighbor in self.get_neighbors(current_node.tile):
-                if any(n.tile == neighbor for n in closed_set):
-                    continue
-
-                move_cost = self.get_movement_cost(current_node.tile, neighbor)
-                if move_cost == float('inf'):
-                    continue
+    def find_paths(self, starts: List[Tile], goals: List[Tile]) -> List[Optional[List[Tile]]]:
+        """
+        Find paths for a batch of agents, pairing each start with its goal.
 
-                new_g_cost = current_node.g_cost + move_cost
-                neighbor_key = (neighbor.x, neighbor.y)
+        Searches share this map's kernel and cost grid, and repeated
+        start/goal pairs in the batch are only searched once.
 
-                # Check if we've found a better path
-                if neighbor_key in open_dict:
-                    existing_node = open_dict[neighbor_key]
-                    if new_g_cost < existing_node.g_cost:
-                        open_set.remove(existing_node)
-                        heapq.heapify(open_set)
-                        del open_dict[neighbor_key]
-                    else:
-                        continue
+        Args:
+            starts: Starting tile of each agent
+            goals: Goal tile of each agent
 
-                new_h_cost = self.heuristic(neighbor, goal)
-                new_node = PathNode(neighbor, new_g_cost, new_h_cost, current_node)
-                heapq.heappush(open_set, new_node)
-                open_dict[neighbor_key] = new_node
+        Returns:
+            List with, per agent, the list of tiles of its path or None if
+            no path exists
+        """
+        if len(starts) != len(goals):
+            raise ValueError("starts and goals must have the same length")
+
+        width, height = self.width, self.height
+        astar = self._astar
+        cost_grid = self._cost_grid
+        searched: Dict[Tuple[int, int], Optional[List[int]]] = {}
+        paths: List[Optional[List[Tile]]] = []
+        for start, goal in zip(starts, goals):
+            if not (0 <= start.x < width and 0 <= start.y < height
+                    and 0 <= goal.x < width and 0 <= goal.y < height):
+                paths.append(None)
+                continue
+            if not start.walkable or not goal.walkable:
+                paths.append(None)
+                continue
 
-        return None  # No path found
+            key = (start.y * width + start.x, goal.y * width + goal.x)
+            if key not in searched:
+                searched[key] = astar(cost_grid, *key)
+            path = searched[key]
+            if path is None:
+                paths.append(None)
+            else:
+                paths.append([self._build_tile(index % width, index // width, index)
+                              for index in path])
+        return paths
 
     def get_map_info(self) -> Dict:
         """
@@ -425,27 +682,54 @@ class GameMap:
         Returns:
             Dictionary containing map statistics
         """
-        tile_counts = {tile_type: 0 for tile_type in TileType}
-        resource_counts = {resource_type: 0 for resource_type in ResourceType}
-
-        for tile in self.tiles.values():
-            tile_counts[tile.tile_type] += 1
-            if tile.resource:
-                resource_counts[tile.resource] += 1
+        tile_counts = self._tile_counts
+        resource_counts = self._resource_counts
 
         return {
             "width": self.width,
             "height": self.height,
-            "total_tiles": len(self.tiles),
+            "total_tiles": self.width * self.height,
             "tile_distribution": {name.value: count for name, count in tile_counts.items()},
             "resources_placed": len(self.resources_placed),
             "resource_distribution": {name.value: count for name, count in resource_counts.items()},
         }
 
+    def get_visible_region(self, center_x: int, center_y: int,
+                           radius: int) -> Tuple[Tuple[int, int, int, int],
+                                                 List[memoryview], List[memoryview]]:
+        """
+        Get zero-copy views of the grids in a visible area around a center point.
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            radius: Radius of visible area
+
+        Returns:
+            Tuple of ((x0, y0, x1, y1) bounds, tile type rows, resource code rows),
+            where each row is a memoryview into the map grid covering x0..x1-1,
+            one per row y0..y1-1 (the views reflect later changes to the map)
+        """
+        width = self.width
+        x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+        y0, y1 = max(0, center_y - radius), min(self.height, center_y + radius + 1)
+        tile_view = memoryview(self.tile_type)
+        resource_view = memoryview(self.resource)
+        tile_rows = []
+        resource_rows = []
+        for y in range(y0, y1):
+            row = y * width
+            tile_rows.append(tile_view[row + x0:row + x1])
+            resource_rows.append(resource_view[row + x0:row + x1])
+        return (x0, y0, x1, y1), tile_rows, resource_rows
+
     def get_visible_area(self, center_x: int, center_y: int, radius: int) -> List[Tile]:
         """
         Get all tiles in a visible area around a center point.
 
+        Builds Tile snapshots for each tile; prefer get_visible_region when
+        only the tile types or resources are needed.
+
         Args:
             center_x: X coordinate of center
             center_y: Y coordinate of center
@@ -454,13 +738,11 @@ class GameMap:
         Returns:
             List of visible tiles
         """
-        visible_tiles = []
-        for x in range(max(0, center_x - radius), min(self.width, center_x + radius + 1)):
-            for y in range(max(0, center_y - radius), min(self.height, center_y + radius + 1)):
-                tile = self.get_tile(x, y)
-                if tile:
-                    visible_tiles.append(tile)
-        return visible_tiles
+        width = self.width
+        x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+        y0, y1 = max(0, center_y - radius), min(self.height, center_y + radius + 1)
+        return [self._build_tile(x, y, y * width + x)
+                for x in range(x0, x1) for y in range(y0, y1)]
 
     def __repr__(self) -> str:
         return f"GameMap(width={self.width}, height={self.height})"
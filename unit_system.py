@@ -4,13 +4,48 @@ Comprehensive system for handling unit creation, movement, combat, abilities, an
 """
 
 from enum import Enum
-from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Callable, Deque, Iterator, List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields
 from abc import ABC, abstractmethod
-import uuid
+from array import array
+from collections import deque
+from itertools import count, islice
+import copy
+import math
+import time
+import weakref
 from datetime import datetime
 
 
+# Formations accepted by UnitGroup.set_formation
+VALID_FORMATIONS = frozenset(("line", "column", "square", "circle"))
+
+# Default attack range of basic unit attacks
+DEFAULT_ATTACK_RANGE = 2.0
+
+# Positions closer than this are considered equal
+POSITION_EPSILON = 1e-9
+
+# Process-wide id sequences for units, groups and abilities created without an
+# explicit id
+_UNIT_IDS = count(1)
+_GROUP_IDS = count(1)
+_ABILITY_IDS = count(1)
+
+# Effect names interned to small integer codes for the per-unit effect columns
+_EFFECT_NAMES: List[str] = ["attack", "heal", "defend", "spell_cast", "stun", "slow"]
+_EFFECT_CODES: Dict[str, int] = {name: code for code, name in enumerate(_EFFECT_NAMES)}
+
+
+def _effect_code(effect_name: str) -> int:
+    """Get the code of an effect name, interning new names."""
+    code = _EFFECT_CODES.get(effect_name)
+    if code is None:
+        code = _EFFECT_CODES[effect_name] = len(_EFFECT_NAMES)
+        _EFFECT_NAMES.append(effect_name)
+    return code
+
+
 class UnitType(Enum):
     """Enumeration of unit types."""
     SOLDIER = "soldier"
@@ -43,7 +78,12 @@ class AbilityType(Enum):
     SUMMON = "summon"
 
 
-@dataclass
+# Enum value strings cached per member for the info dicts
+_UNIT_TYPE_VALUES: Dict[UnitType, str] = {t: t.value for t in UnitType}
+_UNIT_STATE_VALUES: Dict[UnitState, str] = {s: s.value for s in UnitState}
+
+
+@dataclass(slots=True)
 class Position:
     """Represents a position in 2D space."""
     x: float
@@ -51,7 +91,7 @@ class Position:
 
     def distance_to(self, other: "Position") -> float:
         """Calculate Euclidean distance to another position."""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
 
     def move_towards(self, target: "Position", distance: float) -> "Position":
         """Move towards a target position by a given distance."""
@@ -65,11 +105,44 @@ class Position:
         return Position(new_x, new_y)
 
     def __eq__(self, other) -> bool:
-        """Check if two positions are equal."""
-        return self.x == other.x and self.y == other.y
+        """Check if two positions are equal within POSITION_EPSILON."""
+        if not isinstance(other, Position):
+            return NotImplemented
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy <= POSITION_EPSILON * POSITION_EPSILON
+
 
+# Raw slot setters for Position coordinates, bypassing _UnitPosition.__setattr__
+_set_position_x = Position.x.__set__
+_set_position_y = Position.y.__set__
 
-@dataclass
+
+class _UnitPosition(Position):
+    """Live position of a unit; in-place edits mark the manager's grid stale."""
+
+    __slots__ = ("_unit",)
+
+    def __init__(self, unit: "Unit", x: float, y: float):
+        """Initialize a position owned by a unit."""
+        _set_position_x(self, x)
+        _set_position_y(self, y)
+        object.__setattr__(self, "_unit", unit)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set a coordinate and notify the owning unit."""
+        object.__setattr__(self, name, value)
+        self._unit._notify_moved()
+
+    def __repr__(self) -> str:
+        return f"Position(x={self.x!r}, y={self.y!r})"
+
+    def __reduce__(self):
+        # Copies and pickles are plain, unowned positions
+        return (Position, (self.x, self.y))
+
+
+@dataclass(slots=True)
 class Ability:
     """Represents a unit ability."""
     ability_id: str
@@ -85,11 +158,17 @@ class Ability:
     def __post_init__(self):
         """Initialize ability with unique ID if not provided."""
         if not self.ability_id:
-            self.ability_id = str(uuid.uuid4())
+            self.ability_id = f"a{next(_ABILITY_IDS)}"
+
+
+class _LifeHookSlot:
+    """Base of UnitStats holding the owner's life-change hook outside its fields."""
 
+    __slots__ = ("_on_life_change",)
 
-@dataclass
-class UnitStats:
+
+@dataclass(slots=True)
+class UnitStats(_LifeHookSlot):
     """Represents unit statistics."""
     health: float
     max_health: float
@@ -104,38 +183,91 @@ class UnitStats:
     level: int = 1
     experience: int = 0
 
+    def __setattr__(self, name: str, value) -> None:
+        """Set a stat, reporting deaths and revivals to the owning unit."""
+        if name == "health":
+            on_life_change = getattr(self, "_on_life_change", None)
+            if on_life_change is not None:
+                was_alive = self.health > 0
+                object.__setattr__(self, name, value)
+                if was_alive != (value > 0):
+                    on_life_change(value > 0)
+                return
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # Copies and pickles carry the stat values but not the owner's hook
+        return (UnitStats, tuple(getattr(self, f.name) for f in fields(self)))
+
     def take_damage(self, damage: float) -> float:
         """Reduce health by damage amount and return actual damage taken."""
-        actual_damage = min(damage, self.health)
-        self.health = max(0, self.health - damage)
-        return actual_damage
+        health = self.health - damage
+        if health < 0:
+            damage = self.health
+            health = 0
+        self.health = health
+        return damage
 
     def heal(self, amount: float) -> float:
         """Increase health and return actual healing done."""
-        actual_healing = min(amount, self.max_health - self.health)
-        self.health = min(self.max_health, self.health + amount)
-        return actual_healing
+        room = self.max_health - self.health
+        if amount < room:
+            self.health += amount
+            return amount
+        self.health = self.max_health
+        return room
+
+    def restore_mana(self, amount: float) -> float:
+        """Restore mana and return actual amount restored."""
+        room = self.max_mana - self.mana
+        if amount < room:
+            self.mana += amount
+            return amount
+        self.mana = self.max_mana
+        return room
+
+    def restore_stamina(self, amount: float) -> float:
+        """Restore stamina and return actual amount restored."""
+        room = self.max_stamina - self.stamina
+        if amount < room:
+            self.stamina += amount
+            return amount
+        self.stamina = self.max_stamina
+        return room
 
     def restore_resource(self, resource_type: str, amount: float) -> float:
-        """Restore mana or stamina and return actual amount restored."""
-        if resource_type == "mana":
-            actual_restore = min(amount, self.max_mana - self.mana)
-            self.mana = min(self.max_mana, self.mana + amount)
-            return actual_restore
-        elif resource_type == "stamina":
-            actual_restore = min(amount, self.max_stamina - self.stamina)
-            self.stamina = min(self.max_stamina, self.stamina + amount)
-            return actual_restore
-        return 0
+        """Restore mana or stamina by name and return actual amount restored."""
+        restore = _RESOURCE_RESTORERS.get(resource_type)
+        if restore is None:
+            return 0
+        return restore(self, amount)
 
     def is_alive(self) -> bool:
         """Check if unit is alive."""
         return self.health > 0
 
 
+# Raw slot setters for the regenerated stats, bypassing UnitStats.__setattr__
+_set_stats_mana = UnitStats.mana.__set__
+_set_stats_stamina = UnitStats.stamina.__set__
+
+# UnitStats.restore_resource dispatch by resource name
+_RESOURCE_RESTORERS = {
+    "mana": UnitStats.restore_mana,
+    "stamina": UnitStats.restore_stamina,
+}
+
+
 class Unit:
     """Represents a single unit in the game."""
 
+    __slots__ = (
+        "unit_id", "name", "unit_type", "_stats", "_position", "team_id", "state",
+        "abilities", "_effect_codes", "_effect_starts", "_effect_durations",
+        "_effect_data", "target_unit", "movement_target", "last_action_time",
+        "action_cooldown", "_manager_ref",
+    )
+
     def __init__(
         self,
         unit_id: str,
@@ -146,19 +278,72 @@ class Unit:
         team_id: str = ""
     ):
         """Initialize a unit."""
-        self.unit_id = unit_id or str(uuid.uuid4())
+        self.unit_id = unit_id or f"u{next(_UNIT_IDS)}"
         self.name = name
         self.unit_type = unit_type
-        self.stats = stats
-        self.position = position
+        self._stats = self._own_stats(stats)
+        self._position = _UnitPosition(self, position.x, position.y)
         self.team_id = team_id
         self.state = UnitState.IDLE
         self.abilities: Dict[str, Ability] = {}
-        self.active_effects: List[Dict] = []
+        # Active effects as parallel columns: name code, start time, duration
+        # and data (None when the effect carries none)
+        self._effect_codes: List[int] = []
+        self._effect_starts = array('d')
+        self._effect_durations = array('d')
+        self._effect_data: List[Optional[Dict]] = []
         self.target_unit: Optional["Unit"] = None
         self.movement_target: Optional[Position] = None
         self.last_action_time = datetime.utcnow()
         self.action_cooldown = 0.5  # seconds
+        # Weak reference to the owning UnitManager, set while it tracks the unit
+        self._manager_ref: Optional[weakref.ref] = None
+
+    @property
+    def stats(self) -> UnitStats:
+        """Statistics of the unit."""
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: UnitStats) -> None:
+        was_alive = self._stats.health > 0
+        self._stats._on_life_change = None
+        self._stats = self._own_stats(stats)
+        if was_alive != (self._stats.health > 0):
+            self._notify_life_change(not was_alive)
+
+    def _own_stats(self, stats: UnitStats) -> UnitStats:
+        """Hook stats up to this unit, copying them if another unit owns them."""
+        if getattr(stats, "_on_life_change", None) is not None:
+            stats = copy.copy(stats)
+        stats._on_life_change = self._notify_life_change
+        return stats
+
+    @property
+    def position(self) -> Position:
+        """Current position of the unit.
+
+        The returned position is live: editing its coordinates in place moves
+        the unit, just like assigning a new position.
+        """
+        return self._position
+
+    @position.setter
+    def position(self, position: Position) -> None:
+        self._position = _UnitPosition(self, position.x, position.y)
+        self._notify_moved()
+
+    def _notify_life_change(self, alive: bool) -> None:
+        """Tell the owning manager that the unit died or was revived."""
+        manager = self._manager_ref() if self._manager_ref is not None else None
+        if manager is not None:
+            manager._on_life_change(self, alive)
+
+    def _notify_moved(self) -> None:
+        """Tell the owning manager that the unit's position changed."""
+        manager = self._manager_ref() if self._manager_ref is not None else None
+        if manager is not None:
+            manager._grid_dirty = True
 
     def add_ability(self, ability: Ability) -> None:
         """Add an ability to the unit."""
@@ -177,11 +362,8 @@ class Unit:
 
     def can_use_ability(self, ability: Ability) -> bool:
         """Check if unit can use an ability."""
-        if not self.stats.is_alive():
-            return False
-        if ability.cost > self.stats.mana:
-            return False
-        return True
+        stats = self.stats
+        return stats.health > 0 and ability.cost <= stats.mana
 
     def use_ability(self, ability: Ability, target: Optional["Unit"] = None) -> bool:
         """Use an ability."""
@@ -192,53 +374,76 @@ class Unit:
         self.stats.mana = max(0, self.stats.mana - ability.cost)
 
         # Apply ability effects
-        if ability.ability_type == AbilityType.ATTACK and target:
-            damage = ability.damage + self.stats.attack_power * 0.5
-            target.stats.take_damage(damage)
-            self.add_effect("attack", 0.1)
-            return True
-
-        elif ability.ability_type == AbilityType.HEAL and target:
-            healing = ability.healing
-            target.stats.heal(healing)
-            self.add_effect("heal", 0.1)
-            return True
-
-        elif ability.ability_type == AbilityType.DEFEND:
-            self.add_effect("defend", 5.0, {"defense_bonus": ability.damage})
-            self.state = UnitState.IDLE
-            return True
-
-        elif ability.ability_type == AbilityType.SPELL and target:
-            damage = ability.damage
-            target.stats.take_damage(damage)
-            self.add_effect("spell_cast", 1.0)
-            return True
-
-        return False
+        handler = _ABILITY_HANDLERS.get(ability.ability_type)
+        if handler is None:
+            return False
+        return handler(self, ability, target)
 
     def add_effect(self, effect_name: str, duration: float, data: Dict = None) -> None:
         """Add a temporary effect to the unit."""
-        effect = {
-            "name": effect_name,
-            "duration": duration,
-            "start_time": datetime.utcnow(),
-            "data": data or {}
-        }
-        self.active_effects.append(effect)
+        self._effect_codes.append(_effect_code(effect_name))
+        self._effect_starts.append(time.monotonic())
+        self._effect_durations.append(duration)
+        self._effect_data.append(data or None)
 
     def remove_effect(self, effect_name: str) -> bool:
-        """Remove an active effect."""
-        self.active_effects = [e for e in self.active_effects if e["name"] != effect_name]
+        """Remove an active effect, moving the last effect into each gap."""
+        code = _EFFECT_CODES.get(effect_name)
+        codes = self._effect_codes
+        if code is None or code not in codes:
+            return False
+        last = len(codes) - 1
+        for i in range(last, -1, -1):
+            if codes[i] == code:
+                self._drop_effect(i, last)
+                last -= 1
         return True
 
+    def _expire_effects(self, now: float) -> None:
+        """Drop expired effects, moving the last effect into each gap."""
+        starts = self._effect_starts
+        durations = self._effect_durations
+        last = len(starts) - 1
+        for i in range(last, -1, -1):
+            if now - starts[i] >= durations[i]:
+                self._drop_effect(i, last)
+                last -= 1
+
+    def _drop_effect(self, i: int, last: int) -> None:
+        """Remove effect i by moving the last effect (at index last) into its place."""
+        codes = self._effect_codes
+        starts = self._effect_starts
+        durations = self._effect_durations
+        data = self._effect_data
+        if i != last:
+            codes[i] = codes[last]
+            starts[i] = starts[last]
+            durations[i] = durations[last]
+            data[i] = data[last]
+        codes.pop()
+        starts.pop()
+        durations.pop()
+        data.pop()
+
+    @property
+    def active_effects(self) -> List[Dict]:
+        """Active effects as dicts (name, duration, start_time, data)."""
+        return [
+            {
+                "name": _EFFECT_NAMES[code],
+                "duration": duration,
+                "start_time": start_time,
+                "data": data if data is not None else {}
+            }
+            for code, start_time, duration, data in zip(
+                self._effect_codes, self._effect_starts,
+                self._effect_durations, self._effect_data
+            )
+        ]
+
     def get_active_effects(self) -> List[Dict]:
         """Get all active effects."""
-        now = datetime.utcnow()
-        self.active_effects = [
-            e for e in self.active_effects
-            if (now - e["start_time"]).total_seconds() < e["duration"]
-        ]
+        self._expire_effects(time.monotonic())
         return self.active_effects
 
     def move_to(self, target_position: Position) -> None:
@@ -248,12 +453,24 @@ class Unit:
 
     def update_position(self, distance: float) -> None:
         """Update unit position based on movement."""
-        if self.movement_target and self.state == UnitState.MOVING:
-            self.position = self.position.move_towards(self.movement_target, distance)
-            
-            if self.position == self.movement_target:
+        target = self.movement_target
+        if target is not None and self.state == UnitState.MOVING:
+            # Step the position in place; arrival is detected from the
+            # squared distance rather than by comparing positions
+            position = self._position
+            dx = target.x - position.x
+            dy = target.y - position.y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= distance * distance:
+                _set_position_x(position, target.x)
+                _set_position_y(position, target.y)
                 self.movement_target = None
                 self.state = UnitState.IDLE
+            else:
+                ratio = distance / math.sqrt(distance_sq)
+                _set_position_x(position, position.x + dx * ratio)
+                _set_position_y(position, position.y + dy * ratio)
+            self._notify_moved()
 
     def attack(self, target: "Unit") -> bool:
         """Attack a target unit."""
@@ -262,9 +479,7 @@ class Unit:
 
         distance = self.position.distance_to(target.position)
         
-        # Default attack range
-        attack_range = 2.0
-        if distance > attack_range:
+        if distance > DEFAULT_ATTACK_RANGE:
             return False
 
         damage = self.stats.attack_power
@@ -302,29 +517,79 @@ class Unit:
 
     def get_info(self) -> Dict:
         """Get unit information."""
+        position = self._position
+        stats = self._stats
         return {
             "unit_id": self.unit_id,
             "name": self.name,
-            "type": self.unit_type.value,
-            "state": self.state.value,
-            "position": {"x": self.position.x, "y": self.position.y},
-            "health": self.stats.health,
-            "max_health": self.stats.max_health,
-            "mana": self.stats.mana,
-            "level": self.stats.level,
+            "type": _UNIT_TYPE_VALUES[self.unit_type],
+            "state": _UNIT_STATE_VALUES[self.state],
+            "position": {"x": position.x, "y": position.y},
+            "health": stats.health,
+            "max_health": stats.max_health,
+            "mana": stats.mana,
+            "level": stats.level,
             "team_id": self.team_id
         }
 
 
+def _use_attack(user: Unit, ability: Ability, target: Optional[Unit]) -> bool:
+    """Apply an attack ability to a target."""
+    if target is None:
+        return False
+    target.stats.take_damage(ability.damage + user.stats.attack_power * 0.5)
+    user.add_effect("attack", 0.1)
+    return True
+
+
+def _use_heal(user: Unit, ability: Ability, target: Optional[Unit]) -> bool:
+    """Apply a heal ability to a target."""
+    if target is None:
+        return False
+    target.stats.heal(ability.healing)
+    user.add_effect("heal", 0.1)
+    return True
+
+
+def _use_defend(user: Unit, ability: Ability, target: Optional[Unit]) -> bool:
+    """Apply a defend ability to the user."""
+    user.add_effect("defend", 5.0, {"defense_bonus": ability.damage})
+    user.state = UnitState.IDLE
+    return True
+
+
+def _use_spell(user: Unit, ability: Ability, target: Optional[Unit]) -> bool:
+    """Apply a damaging spell to a target."""
+    if target is None:
+        return False
+    target.stats.take_damage(ability.damage)
+    user.add_effect("spell_cast", 1.0)
+    return True
+
+
+# Ability handlers by type; types without a handler have no effect
+_ABILITY_HANDLERS: Dict[AbilityType, Callable[[Unit, Ability, Optional[Unit]], bool]] = {
+    AbilityType.ATTACK: _use_attack,
+    AbilityType.HEAL: _use_heal,
+    AbilityType.DEFEND: _use_defend,
+    AbilityType.SPELL: _use_spell,
+}
+
+
 class UnitGroup:
     """Represents a group of units."""
 
+    __slots__ = ("group_id", "name", "team_id", "units", "_members", "formation", "created_at")
+
     def __init__(self, group_id: str, name: str, team_id: str = ""):
         """Initialize a unit group."""
-        self.group_id = group_id or str(uuid.uuid4())
+        self.group_id = group_id or f"g{next(_GROUP_IDS)}"
         self.name = name
         self.team_id = team_id
         self.units: Dict[str, Unit] = {}
+        # Members in join order; group-wide passes walk this list, while the
+        # units dict serves lookups and duplicate checks
+        self._members: List[Unit] = []
         self.formation: str = "line"  # formation type
         self.created_at = datetime.utcnow()
 
@@ -333,14 +598,16 @@ class UnitGroup:
         if unit.unit_id in self.units:
             return False
         self.units[unit.unit_id] = unit
+        self._members.append(unit)
         return True
 
     def remove_unit(self, unit_id: str) -> bool:
         """Remove a unit from the group."""
-        if unit_id in self.units:
-            del self.units[unit_id]
-            return True
-        return False
+        unit = self.units.pop(unit_id, None)
+        if unit is None:
+            return False
+        self._members.remove(unit)
+        return True
 
     def get_unit(self, unit_id: str) -> Optional[Unit]:
         """Get a unit by ID."""
@@ -348,11 +615,17 @@ class UnitGroup:
 
     def get_all_units(self) -> List[Unit]:
         """Get all units in the group."""
-        return list(self.units.values())
+        return list(self._members)
+
+    def _iter_alive_units(self) -> Iterator[Unit]:
+        """Yield the alive units in the group without building a list."""
+        for unit in self._members:
+            if unit._stats.health > 0:
+                yield unit
 
     def get_alive_units(self) -> List[Unit]:
         """Get all alive units in the group."""
-        return [u for u in self.units.values() if u.stats.is_alive()]
+        return list(self._iter_alive_units())
 
     def get_unit_count(self) -> int:
         """Get the number of units in the group."""
@@ -360,41 +633,65 @@ class UnitGroup:
 
     def get_alive_count(self) -> int:
         """Get the number of alive units."""
-        return len(self.get_alive_units())
+        return sum(1 for u in self._members if u._stats.health > 0)
 
     def set_formation(self, formation: str) -> None:
         """Set the formation of the group."""
-        valid_formations = ["line", "column", "square", "circle"]
-        if formation in valid_formations:
+        if formation in VALID_FORMATIONS:
             self.formation = formation
 
     def move_group(self, target_position: Position) -> None:
         """Move all units in the group to a target position."""
-        for unit in self.units.values():
-            if unit.stats.is_alive():
-                unit.move_to(target_position)
+        for unit in self._iter_alive_units():
+            unit.move_to(target_position)
 
     def attack_target(self, target: Unit) -> int:
         """Have all alive units in the group attack a target."""
+        # Resolve the volley in one pass: alive attackers in range hit in
+        # group order until the target's health runs out, and the summed
+        # damage is applied to the target once
+        target_stats = target.stats
+        target_position = target.position
+        tx, ty = target_position.x, target_position.y
+        range_sq = DEFAULT_ATTACK_RANGE * DEFAULT_ATTACK_RANGE
+        in_combat = UnitState.IN_COMBAT
+        remaining_health = target_stats.health
+        total_damage = 0.0
         successful_attacks = 0
-        for unit in self.get_alive_units():
-            if unit.attack(target):
-                successful_attacks += 1
+        for unit in self._members:
+            if remaining_health <= 0:
+                break
+            stats = unit._stats
+            if stats.health <= 0:
+                continue
+            position = unit.position
+            dx = position.x - tx
+            dy = position.y - ty
+            if dx * dx + dy * dy > range_sq:
+                continue
+
+            remaining_health -= stats.attack_power
+            total_damage += stats.attack_power
+            unit.state = in_combat
+            successful_attacks += 1
+
+        if successful_attacks:
+            target_stats.take_damage(total_damage)
+            target.state = in_combat
         return successful_attacks
 
     def heal_group(self, amount: float) -> None:
         """Heal all units in the group."""
-        for unit in self.units.values():
-            if unit.stats.is_alive():
-                unit.heal(amount)
+        for unit in self._iter_alive_units():
+            unit.heal(amount)
 
     def get_total_health(self) -> float:
         """Get total health of all units."""
-        return sum(u.stats.health for u in self.units.values())
+        return sum(u._stats.health for u in self._members)
 
     def get_total_max_health(self) -> float:
         """Get total max health of all units."""
-        return sum(u.stats.max_health for u in self.units.values())
+        return sum(u._stats.max_health for u in self._members)
 
     def get_group_info(self) -> Dict:
         """Get group information."""
@@ -411,15 +708,167 @@ class UnitGroup:
         }
 
 
+# Default stats per unit type, in UnitStats field order: health, max_health,
+# mana, max_mana, stamina, max_stamina, attack_power, defense, speed, accuracy
+_STATS_TEMPLATES: Dict[UnitType, Tuple[float, ...]] = {
+    UnitType.SOLDIER: (100, 100, 20, 20, 50, 50, 15, 5, 5.0, 0.8),
+    UnitType.KNIGHT: (150, 150, 10, 10, 60, 60, 20, 15, 4.0, 0.7),
+    UnitType.ARCHER: (60, 60, 30, 30, 70, 70, 18, 2, 6.5, 0.95),
+    UnitType.MAGE: (50, 50, 100, 100, 30, 30, 5, 1, 4.5, 0.85),
+    UnitType.HEALER: (70, 70, 80, 80, 40, 40, 8, 3, 4.0, 0.8),
+    UnitType.TANK: (200, 200, 15, 15, 50, 50, 12, 20, 3.0, 0.6),
+}
+
+# Default ability prototypes per unit type, copied onto each new unit
+_ABILITY_TEMPLATES: Dict[UnitType, Ability] = {
+    UnitType.SOLDIER: Ability(
+        ability_id="slash",
+        name="Slash",
+        ability_type=AbilityType.ATTACK,
+        damage=20,
+        range=2,
+        cost=10,
+        description="Basic melee attack"
+    ),
+    UnitType.HEALER: Ability(
+        ability_id="heal",
+        name="Heal",
+        ability_type=AbilityType.HEAL,
+        healing=50,
+        range=5,
+        cost=30,
+        description="Restore health to a target"
+    ),
+    UnitType.MAGE: Ability(
+        ability_id="fireball",
+        name="Fireball",
+        ability_type=AbilityType.SPELL,
+        damage=40,
+        range=8,
+        cost=40,
+        description="Powerful fire spell"
+    ),
+    UnitType.ARCHER: Ability(
+        ability_id="arrow_shot",
+        name="Arrow Shot",
+        ability_type=AbilityType.ATTACK,
+        damage=25,
+        range=10,
+        cost=15,
+        description="Ranged arrow attack"
+    ),
+    UnitType.TANK: Ability(
+        ability_id="shield_bash",
+        name="Shield Bash",
+        ability_type=AbilityType.DEFEND,
+        damage=10,
+        range=2,
+        cost=20,
+        description="Defensive ability that reduces incoming damage"
+    ),
+}
+
+
+def _tick_units(units: List[Optional[Unit]], delta_time: float) -> bool:
+    """Advance movement, effects and resource regen of every live unit in one pass.
+
+    Returns True if any unit moved.
+    """
+    sqrt = math.sqrt
+    set_x = _set_position_x
+    set_y = _set_position_y
+    set_mana = _set_stats_mana
+    set_stamina = _set_stats_stamina
+    now = time.monotonic()
+    moving = UnitState.MOVING
+    idle = UnitState.IDLE
+    moved = False
+    for unit in units:
+        if unit is None:
+            continue
+        stats = unit._stats
+        if stats.health <= 0:
+            continue
+
+        # Movement integration towards the movement target
+        target = unit.movement_target
+        if target is not None and unit.state == moving:
+            position = unit._position
+            dx = target.x - position.x
+            dy = target.y - position.y
+            step = stats.speed * delta_time
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= step * step:
+                set_x(position, target.x)
+                set_y(position, target.y)
+                unit.movement_target = None
+                unit.state = idle
+            else:
+                ratio = step / sqrt(distance_sq)
+                set_x(position, position.x + dx * ratio)
+                set_y(position, position.y + dy * ratio)
+            moved = True
+
+        # Drop expired effects; the expiry scan is inlined and the rare
+        # removal goes through the shared Unit._drop_effect
+        starts = unit._effect_starts
+        if starts:
+            durations = unit._effect_durations
+            last = len(starts) - 1
+            for i in range(last, -1, -1):
+                if now - starts[i] >= durations[i]:
+                    unit._drop_effect(i, last)
+                    last -= 1
+
+        # Restore resources over time, clamped to their maximums
+        max_mana = stats.max_mana
+        mana = stats.mana + max_mana * 0.01 * delta_time
+        set_mana(stats, max_mana if mana > max_mana else mana)
+        max_stamina = stats.max_stamina
+        stamina = stats.stamina + max_stamina * 0.02 * delta_time
+        set_stamina(stats, max_stamina if stamina > max_stamina else stamina)
+
+    return moved
+
+
 class UnitManager:
     """Manages all units and groups in the system."""
 
+    # Cell size of the spatial hash grid used for range queries
+    SPATIAL_CELL_SIZE = 10.0
+
+    # Maximum number of entries kept in the action log
+    ACTION_LOG_LIMIT = 10000
+
     def __init__(self):
         """Initialize the unit manager."""
         self.units: Dict[str, Unit] = {}
         self.groups: Dict[str, UnitGroup] = {}
         self.teams: Dict[str, List[str]] = {}  # team_id -> list of unit_ids
-        self.update_log: List[Dict] = []
+        # (wall-clock timestamp, action) pairs, formatted on read
+        self.update_log: Deque[Tuple[float, str]] = deque(maxlen=self.ACTION_LOG_LIMIT)
+
+        # Dense slot table mirroring self.units for bulk queries: slots are
+        # recycled through a free list, and per-slot columns sit alongside
+        self._slot_units: List[Optional[Unit]] = []
+        self._unit_slots: Dict[str, int] = {}  # unit_id -> slot
+        self._free_slots: List[int] = []
+        self._slot_teams = array('i')  # interned team code per slot
+        self._team_codes: Dict[str, int] = {}
+
+        # Alive units overall and per team, kept up to date as health changes
+        # through UnitStats.take_damage/heal; the per-team dicts keep insertion
+        # order so team listings stay stable
+        self._alive_ids: Set[str] = set()
+        self._alive_by_team: Dict[str, Dict[str, Unit]] = {}
+
+        # Uniform spatial hash grid: cell -> slots of the units in it, rebuilt
+        # lazily on the next range query after any unit moves. Units at NaN or
+        # infinite coordinates have no cell and sit in the overflow list,
+        # which every query scans
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._grid_overflow: List[int] = []
+        self._grid_dirty = True
 
     def create_unit(
         self,
@@ -434,7 +883,7 @@ class UnitManager:
             stats = self._get_default_stats(unit_type)
 
         unit = Unit(
-            unit_id=str(uuid.uuid4()),
+            unit_id=f"u{next(_UNIT_IDS)}",
             name=name,
             unit_type=unit_type,
             stats=stats,
@@ -443,6 +892,7 @@ class UnitManager:
         )
 
         self.units[unit.unit_id] = unit
+        self._assign_slot(unit)
 
         # Add to team tracking
         if team_id:
@@ -453,12 +903,12 @@ class UnitManager:
         # Add default abilities
         self._add_default_abilities(unit)
 
-        self.log_action(f"Unit created: {unit.name} ({unit.unit_type.value})")
+        self.log_action(f"Unit created: {unit.name} ({_UNIT_TYPE_VALUES[unit.unit_type]})")
         return unit
 
     def create_group(self, name: str, team_id: str = "") -> UnitGroup:
         """Create a new unit group."""
-        group = UnitGroup(group_id=str(uuid.uuid4()), name=name, team_id=team_id)
+        group = UnitGroup(group_id=f"g{next(_GROUP_IDS)}", name=name, team_id=team_id)
         self.groups[group.group_id] = group
         self.log_action(f"Group created: {name}")
         return group
@@ -479,9 +929,50 @@ class UnitManager:
             group.remove_unit(unit_id)
 
         del self.units[unit_id]
+        self._release_slot(unit_id)
         self.log_action(f"Unit deleted: {unit.name}")
         return True
 
+    def _assign_slot(self, unit: Unit) -> int:
+        """Place a unit in a free slot of the slot table and return the slot."""
+        team_code = self._team_codes.setdefault(unit.team_id, len(self._team_codes))
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_units[slot] = unit
+            self._slot_teams[slot] = team_code
+        else:
+            slot = len(self._slot_units)
+            self._slot_units.append(unit)
+            self._slot_teams.append(team_code)
+        self._unit_slots[unit.unit_id] = slot
+        unit._manager_ref = weakref.ref(self)
+        if unit._stats.health > 0:
+            self._on_life_change(unit, True)
+        self._grid_dirty = True
+        return slot
+
+    def _release_slot(self, unit_id: str) -> None:
+        """Free the slot table entry of a unit."""
+        slot = self._unit_slots.pop(unit_id)
+        unit = self._slot_units[slot]
+        unit._manager_ref = None
+        self._on_life_change(unit, False)
+        self._slot_units[slot] = None
+        self._free_slots.append(slot)
+        self._grid_dirty = True
+
+    def _on_life_change(self, unit: Unit, alive: bool) -> None:
+        """Update the alive set when a tracked unit dies or is revived."""
+        if alive:
+            self._alive_ids.add(unit.unit_id)
+            if unit.team_id:
+                self._alive_by_team.setdefault(unit.team_id, {})[unit.unit_id] = unit
+        else:
+            self._alive_ids.discard(unit.unit_id)
+            team_alive = self._alive_by_team.get(unit.team_id)
+            if team_alive is not None:
+                team_alive.pop(unit.unit_id, None)
+
     def delete_group(self, group_id: str) -> bool:
         """Delete a unit group."""
         if group_id not in self.groups:
@@ -507,24 +998,87 @@ class UnitManager:
 
     def get_alive_team_units(self, team_id: str) -> List[Unit]:
         """Get all alive units in a team."""
-        return [u for u in self.get_team_units(team_id) if u.stats.is_alive()]
+        return list(self._alive_by_team.get(team_id, {}).values())
+
+    def _rebuild_grid(self) -> None:
+        """Rebuild the spatial hash grid from the current unit positions."""
+        cell_size = self.SPATIAL_CELL_SIZE
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        overflow: List[int] = []
+        for slot, unit in enumerate(self._slot_units):
+            if unit is not None:
+                position = unit._position
+                try:
+                    key = (int(position.x // cell_size), int(position.y // cell_size))
+                except (ValueError, OverflowError):
+                    overflow.append(slot)
+                    continue
+                cell = grid.get(key)
+                if cell is None:
+                    grid[key] = [slot]
+                else:
+                    cell.append(slot)
+        self._grid = grid
+        self._grid_overflow = overflow
+        self._grid_dirty = False
 
     def get_units_in_range(self, position: Position, radius: float) -> List[Unit]:
         """Get all units within a certain range of a position."""
-        return [
-            u for u in self.units.values()
-            if u.position.distance_to(position) <= radius
-        ]
+        if radius < 0:
+            return []
+
+        if self._grid_dirty:
+            self._rebuild_grid()
+
+        # Only the grid cells overlapping the query square are scanned;
+        # squared distances skip the square root per unit
+        px, py = position.x, position.y
+        radius_sq = radius * radius
+        cell_size = self.SPATIAL_CELL_SIZE
+        grid = self._grid
+        min_x, max_x = px - radius, px + radius
+        min_y, max_y = py - radius, py + radius
+        isfinite = math.isfinite
+        if not (isfinite(min_x) and isfinite(max_x) and isfinite(min_y) and isfinite(max_y)):
+            # Unbounded radius or non-finite centre has no cell range; scan
+            # every cell
+            cells = list(grid.values())
+        else:
+            min_cx, max_cx = int(min_x // cell_size), int(max_x // cell_size)
+            min_cy, max_cy = int(min_y // cell_size), int(max_y // cell_size)
+            if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(grid):
+                # Query covers more cells than are occupied; scan those instead
+                cells = list(grid.values())
+            else:
+                cells = [grid[key] for key in (
+                    (cx, cy) for cx in range(min_cx, max_cx + 1) for cy in range(min_cy, max_cy + 1)
+                ) if key in grid]
+        if self._grid_overflow:
+            cells.append(self._grid_overflow)
+
+        slot_units = self._slot_units
+        in_range = []
+        for cell in cells:
+            for slot in cell:
+                unit = slot_units[slot]
+                unit_position = unit._position
+                dx = unit_position.x - px
+                dy = unit_position.y - py
+                if dx * dx + dy * dy <= radius_sq:
+                    in_range.append(unit)
+        return in_range
 
     def get_enemy_units(self, unit_id: str) -> List[Unit]:
         """Get all enemy units relative to a unit."""
-        unit = self.get_unit(unit_id)
-        if not unit:
+        slot = self._unit_slots.get(unit_id)
+        if slot is None:
             return []
 
+        # Compare interned team codes instead of team id strings
+        team_code = self._slot_teams[slot]
         return [
-            u for u in self.units.values()
-            if u.team_id != unit.team_id and u.stats.is_alive()
+            u for u, code in zip(self._slot_units, self._slot_teams)
+            if u is not None and code != team_code and u._stats.health > 0
         ]
 
     def add_unit_to_group(self, unit_id: str, group_id: str) -> bool:
@@ -547,22 +1101,13 @@ class UnitManager:
 
     def update_all_units(self, delta_time: float) -> None:
         """Update all units (called each frame/tick)."""
-        for unit in self.units.values():
-            if unit.stats.is_alive():
-                # Update position
-                unit.update_position(unit.stats.speed * delta_time)
-                
-                # Update effects
-                unit.get_active_effects()
-                
-                # Restore resources over time
-                unit.stats.restore_resource("mana", unit.stats.max_mana * 0.01 * delta_time)
-                unit.stats.restore_resource("stamina", unit.stats.max_stamina * 0.02 * delta_time)
+        if _tick_units(self._slot_units, delta_time):
+            self._grid_dirty = True
 
     def get_system_stats(self) -> Dict:
         """Get overall system statistics."""
         total_units = len(self.units)
-        alive_units = sum(1 for u in self.units.values() if u.stats.is_alive())
+        alive_units = len(self._alive_ids)
         dead_units = total_units - alive_units
 
         return {
@@ -584,14 +1129,20 @@ class UnitManager:
 
     def log_action(self, action: str) -> None:
         """Log a system action."""
-        self.update_log.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": action
-        })
+        self.update_log.append((time.time(), action))
 
     def get_action_log(self, limit: int = 100) -> List[Dict]:
         """Get the action log."""
-        return self.update_log[-limit:]
+        if limit > 0:
+            # Walk back from the newest entry instead of copying the log
+            entries = list(islice(reversed(self.update_log), limit))
+            entries.reverse()
+        else:
+            entries = list(self.update_log)[-limit:]
+        return [
+            {"timestamp": datetime.utcfromtimestamp(timestamp).isoformat(), "action": action}
+            for timestamp, action in entries
+        ]
 
     def clear_action_log(self) -> None:
         """Clear the action log."""
@@ -600,99 +1151,17 @@ class UnitManager:
     @staticmethod
     def _get_default_stats(unit_type: UnitType) -> UnitStats:
         """Get default stats for a unit type."""
-        stats_map = {
-            UnitType.SOLDIER: UnitStats(
-                health=100, max_health=100,
-                mana=20, max_mana=20,
-                stamina=50, max_stamina=50,
-                attack_power=15, defense=5, speed=5.0, accuracy=0.8
-            ),
-            UnitType.KNIGHT: UnitStats(
-                health=150, max_health=150,
-                mana=10, max_mana=10,
-                stamina=60, max_stamina=60,
-                attack_power=20, defense=15, speed=4.0, accuracy=0.7
-            ),
-            UnitType.ARCHER: UnitStats(
-                health=60, max_health=60,
-                mana=30, max_mana=30,
-                stamina=70, max_stamina=70,
-                attack_power=18, defense=2, speed=6.5, accuracy=0.95
-            ),
-            UnitType.MAGE: UnitStats(
-                health=50, max_health=50,
-                mana=100, max_mana=100,
-                stamina=30, max_stamina=30,
-                attack_power=5, defense=1, speed=4.5, accuracy=0.85
-            ),
-            UnitType.HEALER: UnitStats(
-                health=70, max_health=70,
-                mana=80, max_mana=80,
-                stamina=40, max_stamina=40,
-                attack_power=8, defense=3, speed=4.0, accuracy=0.8
-            ),
-            UnitType.TANK: UnitStats(
-                health=200, max_health=200,
-                mana=15, max_mana=15,
-                stamina=50, max_stamina=50,
-                attack_power=12, defense=20, speed=3.0, accuracy=0.6
-            ),
-        }
-        return stats_map.get(unit_type, stats_map[UnitType.SOLDIER])
+        template = _STATS_TEMPLATES.get(unit_type, _STATS_TEMPLATES[UnitType.SOLDIER])
+        return UnitStats(*template)
 
     @staticmethod
     def _add_default_abilities(unit: Unit) -> None:
         """Add default abilities to a unit based on type."""
-        if unit.unit_type == UnitType.SOLDIER:
-            unit.add_ability(Ability(
-                ability_id=str(uuid.uuid4()),
-                name="Slash",
-                ability_type=AbilityType.ATTACK,
-                damage=20,
-                range=2,
-                cost=10,
-                description="Basic melee attack"
-            ))
-        elif unit.unit_type == UnitType.HEALER:
-            unit.add_ability(Ability(
-                ability_id=str(uuid.uuid4()),
-                name="Heal",
-                ability_type=AbilityType.HEAL,
-                healing=50,
-                range=5,
-                cost=30,
-                description="Restore health to a target"
-            ))
-        elif unit.unit_type == UnitType.MAGE:
-            unit.add_ability(Ability(
-                ability_id=str(uuid.uuid4()),
-                name="Fireball",
-                ability_type=AbilityType.SPELL,
-                damage=40,
-                range=8,
-                cost=40,
-                description="Powerful fire spell"
-            ))
-        elif unit.unit_type == UnitType.ARCHER:
-            unit.add_ability(Ability(
-                ability_id=str(uuid.uuid4()),
-                name="Arrow Shot",
-                ability_type=AbilityType.ATTACK,
-                damage=25,
-                range=10,
-                cost=15,
-                description="Ranged arrow attack"
-            ))
-        elif unit.unit_type == UnitType.TANK:
-            unit.add_ability(Ability(
-                ability_id=str(uuid.uuid4()),
-                name="Shield Bash",
-                ability_type=AbilityType.DEFEND,
-                damage=10,
-                range=2,
-                cost=20,
-                description="Defensive ability that reduces incoming damage"
-            ))
+        template = _ABILITY_TEMPLATES.get(unit.unit_type)
+        if template is not None:
+            ability = copy.copy(template)
+            ability.ability_id = f"{unit.unit_id}:{template.ability_id}"
+            unit.add_ability(ability)
 
 
 # Example usage